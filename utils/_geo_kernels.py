@@ -0,0 +1,79 @@
+# utils/_geo_kernels.py - NUMERIC KERNELS FOR ROUTE GEOMETRY (NUMBA WHEN AVAILABLE)
+
+import logging
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def _nearest_point_loop(rp_lat, rp_lng, lat, lng):
+    """Scalar haversine search; fast only once compiled by Numba"""
+    cos_lat = math.cos(lat)
+    best_idx = -1
+    best_a = 2.0  # Haversine a never exceeds 1; a finite sentinel stays valid under fastmath
+    for i in range(rp_lat.shape[0]):
+        sin_dlat = math.sin((rp_lat[i] - lat) / 2)
+        sin_dlng = math.sin((rp_lng[i] - lng) / 2)
+        a = sin_dlat * sin_dlat + cos_lat * math.cos(rp_lat[i]) * sin_dlng * sin_dlng
+        if a < best_a:
+            best_a = a
+            best_idx = i
+    return best_idx, 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(best_a))
+
+
+def _nearest_point_numpy(rp_lat, rp_lng, lat, lng):
+    """Vectorised haversine search used when Numba is not installed"""
+    a = np.sin((rp_lat - lat) / 2) ** 2 + math.cos(lat) * np.cos(rp_lat) * np.sin((rp_lng - lng) / 2) ** 2
+    best_idx = int(a.argmin())
+    return best_idx, 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a[best_idx]))
+
+
+# LLVM fast-math flags minus 'nnan'/'ninf', so comparisons keep IEEE semantics
+_FASTMATH_FLAGS = {'contract', 'afn', 'reassoc', 'arcp', 'nsz'}
+
+
+def _kernels_agree(kernel):
+    """True when kernel matches _nearest_point_numpy on a fixed set of routes and targets"""
+    rng = np.random.default_rng(0)
+    for n in (1, 2, 17, 500):
+        rp_lat = np.radians(rng.uniform(8.0, 35.0, n))
+        rp_lng = np.radians(rng.uniform(68.0, 97.0, n))
+        for lat, lng in ((rp_lat[0], rp_lng[0]), (math.radians(20.0), math.radians(80.0))):
+            idx, km = kernel(rp_lat, rp_lng, lat, lng)
+            ref_idx, ref_km = _nearest_point_numpy(rp_lat, rp_lng, lat, lng)
+            if not math.isclose(km, ref_km, rel_tol=1e-9, abs_tol=1e-9) or (idx != ref_idx and km != ref_km):
+                return False
+    return True
+
+
+# Chosen on the first nearest_point call, so importing (e.g. in each worker process) stays cheap
+_kernel = None
+
+
+def _select_kernel():
+    """Compile and self-check the Numba kernel, falling back to NumPy when it is missing or wrong"""
+    global _kernel
+    kernel = _nearest_point_numpy
+    if njit is not None:
+        compiled = njit(cache=True, fastmath=_FASTMATH_FLAGS)(_nearest_point_loop)
+        if _kernels_agree(compiled):
+            kernel = compiled
+        else:
+            logger.warning("⚠️ Numba nearest_point kernel disagrees with NumPy - using the NumPy version")
+    _kernel = kernel
+    return kernel
+
+
+def nearest_point(rp_lat, rp_lng, lat, lng):
+    """(index, distance_km) of the route point nearest (lat, lng); every angle in radians,
+    rp_lat/rp_lng as non-empty float64 arrays without NaNs"""
+    return (_kernel or _select_kernel())(rp_lat, rp_lng, lat, lng)
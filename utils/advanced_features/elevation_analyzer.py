@@ -4,7 +4,7 @@ import requests
 import json
 import matplotlib.pyplot as plt
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 import tempfile
 import os
 
@@ -51,13 +51,8 @@ class ElevationAnalyzer:
         
         return analysis
     
-    def create_gps_elevation_table(self, elevation_data: List[Dict]) -> List[Dict]:
-        """Create comprehensive GPS coordinates and elevation table for PDF"""
-        
-        if not elevation_data:
-            return []
-        
-        gps_table = []
+    def iter_gps_elevation_rows(self, elevation_data: List[Dict]) -> Iterator[Dict]:
+        """Yield GPS coordinates and elevation table rows one at a time"""
         
         for i, point in enumerate(elevation_data, 1):
             location = point.get('location', {})
@@ -93,7 +88,15 @@ class ElevationAnalyzer:
                 'is_valley': self.is_elevation_valley(elevation_data, i-1)
             }
             
-            gps_table.append(table_row)
+            yield table_row
+    
+    def create_gps_elevation_table(self, elevation_data: List[Dict]) -> List[Dict]:
+        """Create comprehensive GPS coordinates and elevation table for PDF"""
+        
+        if not elevation_data:
+            return []
+        
+        gps_table = list(self.iter_gps_elevation_rows(elevation_data))
         
         print(f"✅ Created GPS elevation table with {len(gps_table)} points")
         return gps_table
@@ -11,8 +11,10 @@ logger = logging.getLogger(__name__)
 class GoogleMapsEnhancements:
     """Enhanced Google Maps features for JMP compliance - NEW FEATURES ONLY"""
     
-    def __init__(self, google_api_key):
+    def __init__(self, google_api_key, session=None):
         self.google_api_key = google_api_key
+        # Shared session keeps connections to maps.googleapis.com alive across calls
+        self.session = session or requests.Session()
         
         # Terrain classification rules
         self.terrain_types = {
@@ -391,7 +393,8 @@ class GoogleMapsEnhancements:
                     'longitude': f"{lng:.6f}",
                     'coordinates_dms': self.convert_to_dms(lat, lng),
                     'distance_from_start': self.calculate_distance_from_start(point, route_points[0]),
-                    'location_description': self.get_location_description(lat, lng)
+                    # Bounded here so every PDF section rendering this row shares one short string
+                    'location_description': self.get_location_description(lat, lng)[:60]
                 }
                 printable_tables['main_route_table'].append(route_entry)
             
@@ -510,7 +513,7 @@ class GoogleMapsEnhancements:
                 'key': self.google_api_key
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -551,7 +554,7 @@ class GoogleMapsEnhancements:
                 'alternatives': 'false'
             }
             
-            response = requests.get(url, params=params, timeout=15)
+            response = self.session.get(url, params=params, timeout=15)
             
             if response.status_code == 200:
                 return response.json()
@@ -628,7 +631,7 @@ class GoogleMapsEnhancements:
                 'key': self.google_api_key
             }
             
-            response = requests.get(url, params=params, timeout=20)
+            response = self.session.get(url, params=params, timeout=20)
             
             if response.status_code == 200:
                 data = response.json()
@@ -13,9 +13,9 @@ logger = logging.getLogger(__name__)
 class GoogleMapsEnhancements:
     """Enhanced Google Maps features for comprehensive route analysis"""
     
-    def __init__(self, google_api_key: str):
+    def __init__(self, google_api_key: str, session: requests.Session = None):
         self.google_api_key = google_api_key
-        self.session = requests.Session()
+        self.session = session or requests.Session()
         
         # Terrain classification rules based on Google place types
         self.terrain_classifiers = {
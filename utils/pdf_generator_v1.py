@@ -1,18 +1,617 @@
 # utils/pdf_generator.py - WORKING ENHANCED VERSION WITH COMPLIANCE & FIXED TEXT RENDERING
 
-from fpdf import FPDF
+from fpdf import FPDF, FPDF_VERSION
 import os
 import datetime
+import math
+import hashlib
+import struct
+import sys
+import threading
+import time
+import zlib
 import matplotlib.pyplot as plt
 import numpy as np
 import io
 import base64
+import polyline
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import tempfile
 import json
+import logging
+import re
+from urllib.parse import urlencode
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from itertools import accumulate, takewhile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from pathlib import Path
+from types import MappingProxyType
 import matplotlib.patches as mpatches
 from matplotlib.patches import Rectangle
 from geopy.distance import geodesic
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# Google Maps Platform terms allow caching Static Maps content for at most 30 days
+MAP_IMAGE_CACHE_MAX_AGE = 30 * 24 * 3600
+
+# Emergency services and alternate routes change slowly; reuse an analysis for a day
+EMERGENCY_CACHE_MAX_AGE = 24 * 3600
+
+# Shared by every process on the host so repeat routes skip the network entirely
+MAP_IMAGE_CACHE_DIR = Path(os.environ.get('MAP_CACHE_DIR') or Path(tempfile.gettempdir()) / "route_pdf_map_cache")
+
+# The API key is not part of an image's identity; drop it before hashing a URL
+_API_KEY_PARAM = re.compile(r'([?&])key=[^&]*&?')
+
+# Failures expected at the map I/O edges: network/disk for downloads, decoding for self.image
+_MAP_FETCH_ERRORS = (requests.RequestException, OSError)
+_MAP_IMAGE_ERRORS = (OSError, ValueError, Image.DecompressionBombError)
+
+# Turn map boxes print ~85 mm wide, so 640 px tiles are shrunk before embedding
+_TURN_IMAGE_MAX_PX = 400
+_TURN_IMAGE_JPEG_QUALITY = 75
+
+# Comprehensive Unicode to ASCII replacements for the latin-1 core PDF fonts
+_TEXT_REPLACEMENTS = {
+    # Emojis to text
+    '📄': '[DOCUMENT]', '🗺️': '[MAP]', '📡': '[SIGNAL]', '⚠️': '[WARNING]',
+    '🔴': '[CRITICAL]', '⏰': '[TIME]', '📋': '[CHECKLIST]', '✅': '[OK]',
+    '❌': '[ERROR]', '🚗': '[CAR]', '🏥': '[HOSPITAL]', '⛽': '[FUEL]',
+    '🏫': '[SCHOOL]', '🚔': '[POLICE]', '🌡️': '[TEMP]', '🌧️': '[RAIN]',
+    '☀️': '[SUN]', '📊': '[CHART]', '🔋': '[BATTERY]', '📱': '[PHONE]',
+    '🛰️': '[SATELLITE]', '🔍': '[SEARCH]', '📍': '[LOCATION]',
+    '🚨': '[EMERGENCY]', '💾': '[STORAGE]', '📈': '[TRENDING]',
+    '🌐': '[INTERNET]', '🎯': '[TARGET]', '🔄': '[REFRESH]',
+    '🆕': '[NEW]', '🏗️': '[CONSTRUCTION]', '⭐': '[STAR]',
+    '🔒': '[LOCKED]', '🔓': '[UNLOCKED]', '🎨': '[DESIGN]',
+    '🎵': '[MUSIC]', '🎬': '[VIDEO]', '📞': '[CALL]',
+    '📧': '[EMAIL]', '📝': '[NOTE]', '📚': '[BOOKS]',
+    '🏠': '[HOME]', '🏢': '[OFFICE]', '🏪': '[SHOP]',
+    '🚀': '[ROCKET]', '⚡': '[LIGHTNING]', '🔥': '[FIRE]',
+    '💧': '[WATER]', '🌟': '[SHINE]', '💡': '[BULB]',
+    '🎁': '[GIFT]', '🎉': '[CELEBRATION]', '🎊': '[CONFETTI]',
+    '🚛': '[TRUCK]', '🏭': '[FACTORY]', '⛽': '[GAS-STATION]',
+    
+    # Symbols to text - FIXED
+    '°': ' degrees', '₹': 'Rs.', '€': 'EUR', '$': 'USD',
+    '£': 'GBP', '¥': 'YEN', '©': '(c)', '®': '(R)',
+    '™': '(TM)', '±': '+/-', '≤': '<=', '≥': '>=',
+    '≠': '!=', '≈': '~=', '×': 'x', '÷': '/',
+    
+    # Quote marks and dashes - FIXED
+    '\u201c': '"', '\u201d': '"', '\u2018': "'", '\u2019': "'",
+    '–': '-', '—': '-', '…': '...',
+    
+    # Arrows - FIXED
+    '→': '->', '←': '<-', '↑': '^', '↓': 'v',
+    '↔': '<->', '⇒': '=>', '⇐': '<=', '⇔': '<=>',
+    
+    # Mathematical symbols - FIXED
+    '∞': 'infinity', '∑': 'sum', '∏': 'product',
+    '∫': 'integral', '∂': 'partial', '∆': 'delta',
+    '√': 'sqrt', '∝': 'proportional', '∈': 'in',
+    '∉': 'not in', '∪': 'union', '∩': 'intersection',
+    
+    # Other common Unicode - FIXED
+    '•': '*', '◦': 'o', '▪': '-', '▫': '-',
+    '★': '[STAR]', '☆': '[STAR-OUTLINE]', '♠': '[SPADE]',
+    '♣': '[CLUB]', '♥': '[HEART]', '♦': '[DIAMOND]',
+    
+    # Fractions - FIXED
+    '½': '1/2', '⅓': '1/3', '⅔': '2/3', '¼': '1/4',
+    '¾': '3/4', '⅕': '1/5', '⅖': '2/5', '⅗': '3/5',
+    
+    # Superscripts and subscripts - FIXED
+    '¹': '1', '²': '2', '³': '3', '⁴': '4', '⁵': '5',
+    '⁶': '6', '⁷': '7', '⁸': '8', '⁹': '9', '⁰': '0',
+    
+    # Additional safety-related symbols - FIXED
+    '⚠': '[WARNING]', '☢': '[RADIOACTIVE]', '☣': '[BIOHAZARD]',
+    '🔥': '[FIRE]', '💀': '[DANGER]',
+}
+
+# Single-pass translation table. Emoji written with a trailing variation
+# selector (U+FE0F) are keyed on their base character and the selector is dropped.
+_CLEAN_TABLE = str.maketrans({key[0]: value for key, value in _TEXT_REPLACEMENTS.items()})
+_CLEAN_TABLE[0xFE0F] = ''
+_NON_LATIN1 = re.compile(r'[^\x00-\xff]')
+
+@lru_cache(maxsize=4096)
+def _clean_text(text):
+    """Translate known symbols to ASCII, then replace anything outside latin-1 with a placeholder"""
+    return _NON_LATIN1.sub('[?]', text.translate(_CLEAN_TABLE))
+
+# Content of the placeholder page shown when the Google Maps enhancement module is missing
+_PLACEHOLDER_FEATURES = (
+    "Supply & Customer Location Details",
+    "Terrain Classification Analysis",
+    "Major Highways Identification",
+    "Time-Specific Congestion Mapping",
+    "Enhanced Elevation Analysis",
+    "Printable GPS Coordinate Tables",
+    "Color-Coded Risk Visualization",
+    "Multi-Layer Route Maps",
+)
+
+_PLACEHOLDER_INSTRUCTIONS = (
+    "1. Create utils/google_maps_enhancements_v1.py with the GoogleMapsEnhancements class",
+    "2. Ensure Google Maps API key is properly configured",
+    "3. Update your generate_pdf function to call integrate_google_maps_enhancements()",
+    "4. All 9 missing JMP features will be automatically added to your PDF reports",
+)
+
+# Static table rows, built once at import instead of on every report
+_RISK_LEGEND_ROWS = (
+    ('🔴 RED', 'EXTREME RISK', 'Blind spots >80°, extreme danger turns'),
+    ('🟠 ORANGE', 'HIGH RISK', 'Sharp turns 70-80°, significant hazards'),
+    ('🟡 YELLOW', 'MEDIUM RISK', 'Moderate turns 45-70°, caution required'),
+    ('🔵 BLUE', 'EMERGENCY SERVICES', 'Hospitals, emergency facilities'),
+    ('🟢 GREEN', 'SAFE ZONES', 'Start/end points, rest areas'),
+    ('🟤 BROWN', 'ELEVATION CHANGES', 'Significant ascents/descents'),
+)
+
+_BASIC_ROAD_ROWS = (
+    ('Minimum Width Required', '7.5 meters for safe operation'),
+    ('Bridge Weight Capacity', 'Manual verification required'),
+    ('Overhead Clearance', '4.2m minimum height needed'),
+    ('Assessment Status', 'Field verification recommended'),
+    ('Route Classification', 'Unknown - Google Roads API needed'),
+    ('Infrastructure Suitability', 'Cannot be determined without APIs'),
+)
+
+_BASIC_LOAD_ROWS = (
+    ('Legal GVW Limit', '49,000 kg maximum'),
+    ('Front Axle Limit', '10,200 kg maximum'),
+    ('Rear Axle Limit', '18,500 kg maximum'),
+    ('Load Distribution', 'Weighbridge verification required'),
+    ('Truck Parking Areas', 'Manual identification needed'),
+    ('Parking Assessment', 'Google Places API required for analysis'),
+)
+
+_COVERAGE_LEGEND_ROWS = (
+    ('Coverage Level', 'Signal Range (dBm)', 'Description', 'Color Code'),
+    ('Excellent', '> -70 dBm', 'Full connectivity', 'Green'),
+    ('Good', '-70 to -85 dBm', 'Reliable connectivity', 'Blue'),
+    ('Fair', '-85 to -100 dBm', 'Adequate connectivity', 'Orange'),
+    ('Poor', '-100 to -110 dBm', 'Unreliable connectivity', 'Red'),
+    ('Dead Zones', '< -110 dBm', 'No connectivity', 'Gray'),
+    ('API Failed', 'Unknown', 'Coverage data unavailable', 'Black'),
+)
+
+# Static regulatory compliance tables (key, value); dynamic rows are added by the page
+_CMVR_ROWS = (
+    ('License Required', 'HMV (Heavy Motor Vehicle)'),
+    ('Permit Required', 'YES - Mandatory for >12 tons'),
+    ('Training Hours Required', '80 hours'),
+    ('Medical Fitness Validity', '3 years'),
+)
+
+_SPEED_LIMIT_ROWS = (
+    ('Urban Areas', '40 km/h'),
+    ('Near Schools', '25 km/h'),
+    ('Highways', '80 km/h'),
+    ('Rural Roads', '60 km/h'),
+    ('Night Driving', 'Reduce by 10 km/h'),
+)
+
+_GPS_TRACKING_ROWS = (
+    ('Accuracy Required', '+/- 3 meters'),
+    ('Update Frequency', '10 seconds'),
+    ('Data Storage', '30 days minimum'),
+    ('Compliance Deadline', 'April 1, 2023'),
+)
+
+_PANIC_BUTTON_ROWS = (
+    ('Location', 'Driver accessible position'),
+    ('Response Time', '<5 seconds'),
+    ('Alert Recipients', 'Police, Owner, Control Center'),
+    ('Installation', 'Authorized centers only'),
+)
+
+_NIGHT_DRIVING_ROWS = (
+    ('Night Hours', '22:00 to 06:00'),
+    ('Speed Reduction', '10 km/h below daytime limits'),
+    ('Additional Safety', 'Enhanced lighting, fatigue monitoring required'),
+)
+
+# Regulatory compliance page lists, cleaned for the PDF core font once at import
+_AIS140_CHECKLIST = tuple(map(_clean_text, (
+    'GPS device installed and functional',
+    'Panic button accessible to driver',
+    'Emergency SOS functionality active',
+    'Overspeed alert system configured',
+    'Data transmission to India-based servers',
+    'Device certification from BIS',
+)))
+
+_CRITICAL_PERMITS = tuple(map(_clean_text, (
+    'Inter-State Permit (Mandatory)',
+    'Heavy Vehicle Permit',
+    'Route Permit for Commercial Vehicles',
+    'Environmental Clearance (if applicable)',
+)))
+
+def _recommendation_rgb(recommendation):
+    """Text color for a compliance recommendation, keyed on its leading word"""
+    if recommendation.startswith('CRITICAL'):
+        return (220, 53, 69)  # Red for critical
+    if recommendation.startswith('Plan'):
+        return (253, 126, 20)  # Orange for time-sensitive
+    if recommendation.startswith(('Check', 'Obtain')):
+        return (13, 110, 253)  # Blue for documentation
+    return (0, 0, 0)  # Black for general
+
+# (text, rgb) pairs so the page loop only unpacks
+_COMPLIANCE_RECOMMENDATIONS = tuple((text, _recommendation_rgb(text)) for text in map(_clean_text, (
+    'CRITICAL: Install AIS-140 compliant GPS tracking system',
+    'CRITICAL: Install panic button accessible to driver',
+    'Plan 2 mandatory rest stops (45 min each) for this journey',
+    'Obtain inter-state permits for all states',
+    'Check Delhi-specific entry requirements',
+    'Carry all vehicle documents (RC, Insurance, PUC)',
+    'Ensure driver medical fitness certificate is valid',
+    'Check vehicle safety equipment (first aid, fire extinguisher)',
+    'Verify speed governor installation and calibration',
+    'Plan route to avoid restricted time zones',
+)))
+
+# Per-turn safety advice; one shared tuple per danger level instead of a new list per page
+_EXTREME_TURN_RECOMMENDATIONS = tuple(map(_clean_text, (
+    "CRAWL SPEED MANDATORY: Reduce speed to 15-20 km/h minimum before entering turn",
+    "HORN WARNING: Sound horn continuously while approaching and taking the turn",
+    "HEADLIGHTS ON: Keep headlights on during daytime for maximum visibility",
+    "AVOID OVERTAKING: Absolutely no overtaking 200m before and after this turn",
+    "STAY IN LANE: Keep to the extreme left of your lane throughout the turn",
+    "PASSENGER ALERT: Warn all passengers about the dangerous blind spot ahead",
+    "EMERGENCY PREP: Have emergency contact ready - accidents common at such turns",
+    "WEATHER CHECK: Avoid this turn in rain, fog, or night conditions if possible",
+)))
+
+_SHARP_TURN_RECOMMENDATIONS = tuple(map(_clean_text, (
+    "REDUCE SPEED: Slow down to 25-30 km/h before entering the sharp turn",
+    "USE HORN: Sound horn to alert oncoming traffic of your presence",
+    "MAINTAIN DISTANCE: Keep safe distance from vehicle ahead (minimum 50m)",
+    "PROPER LANE: Stay in correct lane and avoid cutting corners",
+    "CHECK MIRRORS: Monitor traffic behind before slowing down",
+    "GEAR DOWN: Use appropriate gear for controlled speed through turn",
+    "AVOID BRAKING: Complete braking before turn, not during the turn",
+    "POST-TURN CAUTION: Accelerate gradually after completing the turn",
+)))
+
+# Vehicle details for the compliance pages, by vehicle type (read-only; shared by every report)
+_VEHICLE_PROFILES = MappingProxyType({
+    "heavy_goods_vehicle": {
+        "type": "heavy_goods_vehicle",
+        "weight": 18000,  # 18 tons
+        "passenger_capacity": 2,
+        "vehicle_category": "Heavy Goods Vehicle",
+        "fuel_type": "Diesel"
+    },
+    "medium_goods_vehicle": {
+        "type": "medium_goods_vehicle", 
+        "weight": 8000,   # 8 tons
+        "passenger_capacity": 2,
+        "vehicle_category": "Medium Goods Vehicle",
+        "fuel_type": "Diesel"
+    },
+    "light_vehicle": {
+        "type": "light_motor_vehicle",
+        "weight": 2500,   # 2.5 tons
+        "passenger_capacity": 5,
+        "vehicle_category": "Light Motor Vehicle",
+        "fuel_type": "Petrol"
+    },
+    "bus": {
+        "type": "passenger_vehicle",
+        "weight": 12000,  # 12 tons
+        "passenger_capacity": 45,
+        "vehicle_category": "Passenger Vehicle",
+        "fuel_type": "Diesel"
+    }
+})
+
+# Text color for each elevation risk level in the GPS coordinates table
+_RISK_RGB = {
+    'CRITICAL': (220, 53, 69),   # Red
+    'HIGH': (253, 126, 20),      # Orange
+    'MEDIUM': (108, 117, 125),   # Gray
+    'LOW': (0, 0, 0),            # Black
+}
+
+# Network coverage row text color by quality; anything else (API failed) is black
+_QUALITY_RGB = {
+    'excellent': (40, 167, 69),  # Green
+    'good': (13, 110, 253),      # Blue
+    'fair': (253, 126, 20),      # Orange
+    'poor': (220, 53, 69),       # Red
+    'dead': (108, 117, 125),     # Gray
+}
+
+# "1 day 3 hours", "2 hours 30 mins", "2h 30m" -> (value, unit initial) pairs
+_DURATION_RE = re.compile(r'(\d+(?:\.\d+)?)\s*([dhm])', re.IGNORECASE)
+_DURATION_UNIT_HOURS = {'d': 24.0, 'h': 1.0, 'm': 1 / 60}
+
+# "1,234.5 km" / "850 m" -> number with thousands separators, optional metre unit
+_DISTANCE_RE = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*(km|m\b)?', re.IGNORECASE)
+
+def _duration_hours(duration_str, default):
+    """Sum every day/hour/minute component of a duration string, or default if none is found"""
+    parts = _DURATION_RE.findall(duration_str or '')
+    if not parts:
+        return default
+    return sum(float(value) * _DURATION_UNIT_HOURS[unit.lower()] for value, unit in parts)
+
+def _prepare_coverage_rows(coverage_points):
+    """Format network coverage points as (text color, cell strings) rows ready to draw"""
+    rows = []
+    for idx, point in enumerate(coverage_points, 1):
+        coords = point.get('coordinates') or {}
+        coverage_data = point.get('coverage_data') or {}
+        quality = point.get('coverage_quality', 'unknown')
+        
+        # Get signal strength and technologies
+        signal_dbm = coverage_data.get('strongest_signal_dbm', -120)
+        technologies = coverage_data.get('available_technologies', [])
+        tech_str = ', '.join(technologies[:2]) if technologies else 'None'
+        
+        rows.append((_QUALITY_RGB.get(quality, (0, 0, 0)), (
+            str(idx),
+            quality.replace('_', ' ').title(),
+            f"{signal_dbm} dBm" if signal_dbm > -120 else "No Signal",
+            f"{coords.get('lat', 0):.4f}",
+            f"{coords.get('lng', 0):.4f}",
+            _clean_text(tech_str[:15]),
+        )))
+    return rows
+
+_HV_FUEL_KM_PER_L = 3.5  # km/L for heavy vehicles
+
+def _hv_metrics(distance_km, base_hours):
+    """Heavy vehicle (adjusted_hours, rest_stops, fuel_needed) for the basic analysis page"""
+    adjusted_hours = base_hours * 1.3  # 30% increase for heavy vehicle
+    rest_stops = max(0, int(adjusted_hours / 4.5))
+    fuel_needed = distance_km / _HV_FUEL_KM_PER_L if distance_km > 0 else 0
+    return adjusted_hours, rest_stops, fuel_needed
+
+def _route_array(route_points):
+    """Route as one (n, 2) float64 array of (lat, lng) rows, or None if the points are ragged/malformed"""
+    try:
+        points = np.asarray(route_points, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    if points.ndim != 2 or points.shape[1] < 2:
+        return None
+    return points[:, :2]
+
+def _route_center(route_points, points=None):
+    """Mean (lat, lng) of a non-empty route, in one NumPy pass when the points are well formed
+    
+    points is the optional _route_array(route_points), passed when the caller already has it.
+    """
+    if points is None:
+        points = _route_array(route_points)
+    if points is None:
+        return (sum(point[0] for point in route_points) / len(route_points),
+                sum(point[1] for point in route_points) / len(route_points))
+    center_lat, center_lng = points.mean(axis=0)
+    return float(center_lat), float(center_lng)
+
+def _route_radians(route_points, step=10, points=None):
+    """Every step-th route point as a (2, n) float64 array of radians (lat row, lng row), or None if empty/malformed"""
+    if points is not None:
+        points = points[::step]
+    else:
+        try:
+            points = np.asarray([point[:2] for point in route_points[::step]], dtype=np.float64)
+        except (TypeError, ValueError, IndexError):
+            return None
+    if points.ndim != 2 or not len(points) or np.isnan(points).any():
+        return None
+    # Transposed copy keeps each coordinate row contiguous for the distance kernel
+    return np.radians(points.T.copy())
+
+def _trunc(text, limit):
+    """Shorten text to limit characters plus an ellipsis; short strings are returned as-is"""
+    return text if len(text) <= limit else text[:limit] + '...'
+
+# Above this many turns the NumPy comparison beats the Python loop
+_VECTORIZE_MIN_TURNS = 512
+
+def _angles_array(sharp_turns):
+    """Turn angles as a float64 array (float64 keeps 80.000001 on the correct side of a boundary)"""
+    return np.fromiter((t.get('angle', 0) for t in sharp_turns), dtype=np.float64, count=len(sharp_turns))
+
+def _risk_bucket_counts(sharp_turns, extreme_above=80, angles=None):
+    """Count turns as (extreme >extreme_above, high 70-extreme_above, medium 45-70 degrees) in one pass"""
+    if angles is None and len(sharp_turns) > _VECTORIZE_MIN_TURNS:
+        angles = _angles_array(sharp_turns)
+    if angles is not None:
+        extreme = int(np.count_nonzero(angles > extreme_above))
+        high = int(np.count_nonzero((angles >= 70) & (angles <= extreme_above)))
+        medium = int(np.count_nonzero((angles >= 45) & (angles < 70)))
+        return extreme, high, medium
+    
+    extreme = high = medium = 0
+    for turn in sharp_turns:
+        angle = turn.get('angle', 0)
+        if angle > extreme_above:
+            extreme += 1
+        elif angle >= 70:
+            high += 1
+        elif angle >= 45:
+            medium += 1
+    return extreme, high, medium
+
+def create_http_session():
+    """Build a pooled, retrying session shared by the Google Maps API and Static Maps calls"""
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    # Everything goes to maps.googleapis.com; size the pool for the turn-map prefetch
+    # (4 workers, each probing up to 4 Street View locations at once) plus the render thread
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=24, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Process-wide session so keep-alive connections outlive a single report
+_HTTP_SESSION = create_http_session()
+
+def _fetch_map_bytes(url, timeout=25, min_bytes=0):
+    """Download a Static Maps image once per process and cache period; HTTP errors raise and are not cached
+    
+    Returns (content, validators) where validators holds the ETag/Last-Modified headers.
+    A Content-Length below min_bytes returns empty content without reading the body.
+    """
+    # The period is part of the key so the in-memory copy never outlives the disk cache TTL
+    return _fetch_map_bytes_cached(url, timeout, min_bytes, int(time.time() // MAP_IMAGE_CACHE_MAX_AGE))
+
+@lru_cache(maxsize=256)
+def _fetch_map_bytes_cached(url, timeout, min_bytes, period):
+    """_fetch_map_bytes body; period only partitions the cache"""
+    with _HTTP_SESSION.get(url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        declared = response.headers.get('Content-Length', '')
+        if declared.isdigit() and int(declared) < min_bytes:
+            logger.debug("⚠️ Skipping %s-byte response without downloading it", declared)
+            return b'', {}
+        return response.content, _response_validators(response)
+
+def _response_validators(response):
+    """Cache validators worth sending back on a conditional request"""
+    return {name: response.headers[name] for name in ('ETag', 'Last-Modified') if name in response.headers}
+
+def _atomic_write(path, data):
+    """Write to a sibling temp file and rename so readers never see a partial file"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as temp:
+            temp.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        os.unlink(tmp_path)
+        raise
+
+# Batch jobs whose reports are not read back soon can ask the kernel to evict them after writing
+DROP_PDF_PAGE_CACHE = os.environ.get('PDF_DROP_PAGE_CACHE') == '1'
+
+def _drop_page_cache(path):
+    """Flush a freshly written file and drop it from the page cache (POSIX only, best effort)"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)  # DONTNEED only evicts clean pages
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.debug("Could not drop %s from the page cache: %s", path, e)
+
+# GIL switch interval while a report renders next to its download threads (CPython default 5 ms)
+_RENDER_SWITCH_INTERVAL = 0.05
+_switch_interval_lock = threading.Lock()
+_switch_interval_users = 0
+_switch_interval_saved = None
+
+@contextmanager
+def _render_switch_interval():
+    """Let the rendering thread hold the GIL longer while I/O-bound prefetch threads run
+    
+    The interval is process-wide, so concurrent reports share one saved value and the
+    last one to finish restores it.
+    """
+    global _switch_interval_users, _switch_interval_saved
+    with _switch_interval_lock:
+        if _switch_interval_users == 0:
+            _switch_interval_saved = sys.getswitchinterval()
+            sys.setswitchinterval(max(_switch_interval_saved, _RENDER_SWITCH_INTERVAL))
+        _switch_interval_users += 1
+    try:
+        yield
+    finally:
+        with _switch_interval_lock:
+            _switch_interval_users -= 1
+            if _switch_interval_users == 0:
+                sys.setswitchinterval(_switch_interval_saved)
+
+def _emergency_cache_name(route_data, api_key):
+    """File name for a cached emergency analysis: digest of the planner's inputs, scoped to the API key"""
+    dead_zones = (route_data.get('network_coverage') or {}).get('dead_zones', [])
+    payload = json.dumps([route_data.get('route_points', []), dead_zones], sort_keys=True, default=str)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(api_key).encode('utf-8') + b'\0')
+    digest.update(payload.encode('utf-8'))
+    return f"{digest.hexdigest()}.json"
+
+def _poi_offsets(name):
+    """Deterministic (lat, lng) offsets in [-0.005, 0.005) derived from a POI name
+    
+    Stable across processes (unlike hash(), which is salted per run) and thread-safe
+    (no shared RNG state to reseed).
+    """
+    a, b = struct.unpack('<II', hashlib.blake2b(str(name).encode('utf-8'), digest_size=8).digest())
+    return (a / 2**32 - 0.5) * 0.01, (b / 2**32 - 0.5) * 0.01
+
+def _static_map_size(width_mm, height_mm):
+    """Static Maps size= for a box in mm: 96 dpi pixels with the box's aspect ratio, capped at 640
+    
+    Requested with scale=2, so Google returns twice these pixels at no extra cost.
+    """
+    px_w, px_h = width_mm * 96 / 25.4, height_mm * 96 / 25.4
+    shrink = min(1.0, 640 / max(px_w, px_h))
+    return f"{int(px_w * shrink)}x{int(px_h * shrink)}"
+
+_STATIC_MAP_BASE = "https://maps.googleapis.com/maps/api/staticmap"
+
+@lru_cache(maxsize=512)
+def _static_url(lat, lng, map_type, zoom, size, api_key):
+    """Static Maps URL centred on (lat, lng) with a red marker there, built once per tile
+    
+    Coordinates are fixed to 6 decimals (~0.1 m) so float noise maps to the same URL.
+    """
+    point = f"{lat:.6f},{lng:.6f}"
+    return f"{_STATIC_MAP_BASE}?" + urlencode([
+        ('center', point),
+        ('zoom', zoom),
+        ('size', size),
+        ('scale', 2),
+        ('maptype', map_type),
+        ('markers', f"color:red|size:mid|{point}"),
+        ('key', api_key),
+    ], safe=',:|')
+
+def _streetview_attempts(lat, lng):
+    """(lat, lng, heading) Street View candidates for a turn, in priority order"""
+    return [
+        (lat, lng, 0),    # Original location, north
+        (lat, lng, 90),   # Original location, east  
+        (lat, lng, 180),  # Original location, south
+        (lat, lng, 270),  # Original location, west
+        (lat + 0.0001, lng, 0),     # Slightly north
+        (lat - 0.0001, lng, 0),     # Slightly south
+        (lat, lng + 0.0001, 0),     # Slightly east
+        (lat, lng - 0.0001, 0),     # Slightly west
+    ]
+
+def _downscale_image(content, max_px=_TURN_IMAGE_MAX_PX, quality=_TURN_IMAGE_JPEG_QUALITY):
+    """Shrink an image to fit max_px and re-encode as JPEG; small or unreadable images are returned untouched"""
+    try:
+        with Image.open(io.BytesIO(content)) as img:
+            if img.width <= max_px and img.height <= max_px:
+                return content
+            img.thumbnail((max_px, max_px))
+            out = io.BytesIO()
+            img.convert('RGB').save(out, 'JPEG', quality=quality, optimize=True)
+            return out.getvalue()
+    except (OSError, Image.DecompressionBombError) as e:
+        logger.warning("⚠️ Could not downscale map image: %s", e)
+        return content
 
 # Add these imports
 try:
@@ -24,12 +623,67 @@ except ImportError as e:
     ElevationAnalyzer = None
     EmergencyPlanner = None
 
+# The legacy 'fpdf' 1.x package installs the same module name and builds output by
+# string concatenation; fpdf2 (requirements.txt) writes into a bytearray buffer
+if int(FPDF_VERSION.split('.')[0]) < 2:
+    print(f"⚠️ fpdf {FPDF_VERSION} detected - run 'pip uninstall fpdf && pip install fpdf2' for fast PDF output")
+
+# FAST_PDF=1 deflates page streams at zlib level 1: several times faster, a few percent larger
+FAST_PDF = os.environ.get('FAST_PDF') == '1'
+_FAST_PDF_ZLIB_LEVEL = 1
+# _FastFlateOutputProducer relies on fpdf2 internals (OutputProducer._add_pages and the
+# PDFContentStream _contents/filter/length fields); only enable it on the release it was checked against
+_FAST_PDF_FPDF_VERSION = "2.7.6"
+
+try:
+    if FPDF_VERSION != _FAST_PDF_FPDF_VERSION:
+        raise ImportError(f"fpdf {FPDF_VERSION} is untested")
+    from fpdf.output import OutputProducer
+    from fpdf.syntax import Name
+except ImportError:  # Legacy fpdf 1.x or an untested fpdf2 release: FAST_PDF is ignored
+    _FastFlateOutputProducer = None
+else:
+    class _FastFlateOutputProducer(OutputProducer):
+        """fpdf2 output producer that compresses page content streams at _FAST_PDF_ZLIB_LEVEL
+        
+        fpdf2 always uses zlib's default level (6); pages are collected uncompressed and
+        deflated here instead. Overrides private fpdf2 internals, see _FAST_PDF_FPDF_VERSION.
+        """
+        
+        def _add_pages(self, _slice=slice(0, None)):
+            fpdf = self.fpdf
+            compress, fpdf.compress = fpdf.compress, False
+            try:
+                page_objs = super()._add_pages(_slice)
+            finally:
+                fpdf.compress = compress
+            if compress:
+                for page_obj in page_objs:
+                    stream = page_obj.contents
+                    stream._contents = zlib.compress(stream._contents, _FAST_PDF_ZLIB_LEVEL)
+                    stream.filter = Name("FlateDecode")
+                    stream.length = len(stream._contents)
+            return page_objs
+
+from utils._geo_kernels import nearest_point
+
+try:
+    from utils.heavy_vehicle_analyzer import HeavyVehicleRouteAnalyzer
+except ImportError:
+    HeavyVehicleRouteAnalyzer = None
+
 class EnhancedRoutePDF(FPDF):
+    # (setter arguments, resulting color object) of the last emitted fill/draw color
+    _fill_color_state = None
+    _draw_color_state = None
+    
     def __init__(self, title=None):
         super().__init__()
         self.title = title or "Enhanced Route Analysis Report"
         self.company_name = "Route Analytics Pro"
         self.set_auto_page_break(auto=True, margin=15)
+        # Deflate page content streams (fpdf2); reports are mostly text and table borders
+        self.set_compression(True)
         
         # Professional color scheme
         self.primary_color = (52, 58, 64)
@@ -40,101 +694,120 @@ class EnhancedRoutePDF(FPDF):
         self.success_color = (40, 167, 69)
         self.info_color = (13, 110, 253)
         
+        # On-disk cache for downloaded Static Maps images (SHA-256 of the keyless URL -> PNG)
+        self._map_image_cache_dir = MAP_IMAGE_CACHE_DIR
+        
+        # One connection pool for every Google Maps request made by this process
+        self.session = _HTTP_SESSION
+        # (sharp_turns list, angle array) shared by every turn-stats section of this report
+        self._angles_cache = None
+        # (sharp_turns list, turns sorted by angle) shared by the map markers and turn pages
+        self._turns_by_angle_cache = None
+        # (sharp_turns list, its >= 70 degree prefix) for the turn pages, prefetch and page count
+        self._critical_turns_cache = None
+        # (route_points list, _route_array) shared by the map center, route path and POI lookups
+        self._route_array_cache = None
+        # (route_points list, sampled radians array) shared by every POI distance lookup
+        self._route_radians_cache = None
+        # (lat, lng) -> Street View metadata verdict, shared by turn-map prefetch and rendering
+        self._streetview_status = {}
+        # Street View time budget per turn, and give up for the whole report after a run of failed downloads
+        self._map_budget_s = 30
+        self._streetview_max_fail_streak = 10
+        self._streetview_fail_streak = 0
+        self._streetview_disabled = False
+        # Background turn-map downloads: (lat, lng) -> future, see start_turn_map_prefetch
+        self._prefetch_executor = None
+        self._prefetch_stop = None
+        self._turn_prefetches = {}
+        # Background emergency analysis: (route_data, api_key, future), see start_emergency_prefetch
+        self._emergency_prefetch = None
+        self._emergency_wait_s = 120
+        
+    def output(self, *args, **kwargs):
+        """Write the PDF, cancelling any turn-map downloads still queued"""
+        if FAST_PDF and _FastFlateOutputProducer is not None:
+            kwargs.setdefault('output_producer_class', _FastFlateOutputProducer)
+        try:
+            return super().output(*args, **kwargs)
+        finally:
+            self._stop_turn_map_prefetch()
+    
+    def set_fill_color(self, r, g=-1, b=-1):
+        """Set fill color, skipping the content-stream operator when it is already active"""
+        state = self._fill_color_state
+        if self.page > 0 and state and state[0] == (r, g, b) and state[1] is self.fill_color:
+            return
+        super().set_fill_color(r, g, b)
+        self._fill_color_state = ((r, g, b), self.fill_color)
+    
+    def set_draw_color(self, r, g=-1, b=-1):
+        """Set draw color, skipping the content-stream operator when it is already active"""
+        state = self._draw_color_state
+        if self.page > 0 and state and state[0] == (r, g, b) and state[1] is self.draw_color:
+            return
+        super().set_draw_color(r, g, b)
+        self._draw_color_state = ((r, g, b), self.draw_color)
+    
+    def set_line_width(self, width):
+        """Set line width, skipping the content-stream operator when it is already active
+        
+        FPDF keeps line_width in step with the page state (add_page and graphics-state
+        pops restore it), so an equal value means the operator would be a no-op.
+        """
+        if self.page > 0 and width == self.line_width:
+            return
+        super().set_line_width(width)
+    
+    def _turn_angles(self, sharp_turns):
+        """Angle array for large turn lists, built once per list and reused across sections"""
+        if len(sharp_turns) <= _VECTORIZE_MIN_TURNS:
+            return None
+        if self._angles_cache is None or self._angles_cache[0] is not sharp_turns:
+            self._angles_cache = (sharp_turns, _angles_array(sharp_turns))
+        return self._angles_cache[1]
+    
+    def _turns_by_angle(self, sharp_turns):
+        """sharp_turns sorted most dangerous first, built once per list and reused across sections"""
+        if not sharp_turns:
+            return []
+        if self._turns_by_angle_cache is None or self._turns_by_angle_cache[0] is not sharp_turns:
+            self._turns_by_angle_cache = (sharp_turns, sorted(sharp_turns, key=lambda x: x.get('angle', 0), reverse=True))
+        return self._turns_by_angle_cache[1]
+    
+    def _critical_turns(self, sharp_turns):
+        """Blind spots and sharp danger turns (>= 70 degrees), most dangerous first
+        
+        Cached alongside _turns_by_angle; callers must not mutate the returned list.
+        """
+        if self._critical_turns_cache is None or self._critical_turns_cache[0] is not sharp_turns:
+            critical = list(takewhile(lambda turn: turn.get('angle', 0) >= 70, self._turns_by_angle(sharp_turns)))
+            self._critical_turns_cache = (sharp_turns, critical)
+        return self._critical_turns_cache[1]
+    
+    def _route_points_array(self, route_points):
+        """_route_array(route_points), converted once per route list instead of once per pass"""
+        if self._route_array_cache is None or self._route_array_cache[0] is not route_points:
+            self._route_array_cache = (route_points, _route_array(route_points))
+        return self._route_array_cache[1]
+    
+    def _sampled_route_radians(self, route_points):
+        """_route_radians(route_points), built once per route list and reused by every POI"""
+        if self._route_radians_cache is None or self._route_radians_cache[0] is not route_points:
+            points = self._route_points_array(route_points)
+            self._route_radians_cache = (route_points, _route_radians(route_points, points=points))
+        return self._route_radians_cache[1]
+    
     def clean_text(self, text):
         """Clean text for PDF compatibility - COMPREHENSIVE EMOJI/UNICODE HANDLING"""
         if not isinstance(text, str):
             text = str(text)
-        
-        # Comprehensive Unicode to ASCII replacements
-        replacements = {
-            # Emojis to text
-            '📄': '[DOCUMENT]', '🗺️': '[MAP]', '📡': '[SIGNAL]', '⚠️': '[WARNING]',
-            '🔴': '[CRITICAL]', '⏰': '[TIME]', '📋': '[CHECKLIST]', '✅': '[OK]',
-            '❌': '[ERROR]', '🚗': '[CAR]', '🏥': '[HOSPITAL]', '⛽': '[FUEL]',
-            '🏫': '[SCHOOL]', '🚔': '[POLICE]', '🌡️': '[TEMP]', '🌧️': '[RAIN]',
-            '☀️': '[SUN]', '📊': '[CHART]', '🔋': '[BATTERY]', '📱': '[PHONE]',
-            '🛰️': '[SATELLITE]', '🔍': '[SEARCH]', '📍': '[LOCATION]',
-            '🚨': '[EMERGENCY]', '💾': '[STORAGE]', '📈': '[TRENDING]',
-            '🌐': '[INTERNET]', '🎯': '[TARGET]', '🔄': '[REFRESH]',
-            '🆕': '[NEW]', '🏗️': '[CONSTRUCTION]', '⭐': '[STAR]',
-            '🔒': '[LOCKED]', '🔓': '[UNLOCKED]', '🎨': '[DESIGN]',
-            '🎵': '[MUSIC]', '🎬': '[VIDEO]', '📞': '[CALL]',
-            '📧': '[EMAIL]', '📝': '[NOTE]', '📚': '[BOOKS]',
-            '🏠': '[HOME]', '🏢': '[OFFICE]', '🏪': '[SHOP]',
-            '🚀': '[ROCKET]', '⚡': '[LIGHTNING]', '🔥': '[FIRE]',
-            '💧': '[WATER]', '🌟': '[SHINE]', '💡': '[BULB]',
-            '🎁': '[GIFT]', '🎉': '[CELEBRATION]', '🎊': '[CONFETTI]',
-            '🚛': '[TRUCK]', '🏭': '[FACTORY]', '⛽': '[GAS-STATION]',
-            
-            # Symbols to text - FIXED
-            '°': ' degrees', '₹': 'Rs.', '€': 'EUR', '$': 'USD',
-            '£': 'GBP', '¥': 'YEN', '©': '(c)', '®': '(R)',
-            '™': '(TM)', '±': '+/-', '≤': '<=', '≥': '>=',
-            '≠': '!=', '≈': '~=', '×': 'x', '÷': '/',
-            
-            # Quote marks and dashes - FIXED
-            '"': '"', '"': '"', ''': "'", ''': "'",
-            '–': '-', '—': '-', '…': '...',
-            
-            # Arrows - FIXED
-            '→': '->', '←': '<-', '↑': '^', '↓': 'v',
-            '↔': '<->', '⇒': '=>', '⇐': '<=', '⇔': '<=>',
-            
-            # Mathematical symbols - FIXED
-            '∞': 'infinity', '∑': 'sum', '∏': 'product',
-            '∫': 'integral', '∂': 'partial', '∆': 'delta',
-            '√': 'sqrt', '∝': 'proportional', '∈': 'in',
-            '∉': 'not in', '∪': 'union', '∩': 'intersection',
-            
-            # Other common Unicode - FIXED
-            '•': '*', '◦': 'o', '▪': '-', '▫': '-',
-            '★': '[STAR]', '☆': '[STAR-OUTLINE]', '♠': '[SPADE]',
-            '♣': '[CLUB]', '♥': '[HEART]', '♦': '[DIAMOND]',
-            
-            # Fractions - FIXED
-            '½': '1/2', '⅓': '1/3', '⅔': '2/3', '¼': '1/4',
-            '¾': '3/4', '⅕': '1/5', '⅖': '2/5', '⅗': '3/5',
-            
-            # Superscripts and subscripts - FIXED
-            '¹': '1', '²': '2', '³': '3', '⁴': '4', '⁵': '5',
-            '⁶': '6', '⁷': '7', '⁸': '8', '⁹': '9', '⁰': '0',
-            
-            # Additional safety-related symbols - FIXED
-            '⚠': '[WARNING]', '☢': '[RADIOACTIVE]', '☣': '[BIOHAZARD]',
-            '🔥': '[FIRE]', '💀': '[DANGER]',
-        }
-        
-        # Apply replacements ONLY for specific unicode characters
-        for old, new in replacements.items():
-            if old in text:  # Only replace if the character exists
-                text = text.replace(old, new)
-        
-        # Simple approach - if text can be encoded as latin-1, return as-is
-        try:
-            text.encode('latin-1')
+        # Plain ASCII has nothing to replace except '$'; skip the translate pass and
+        # keep one-off strings (addresses, coordinates) from evicting cached entries
+        if text.isascii() and '$' not in text:
             return text
-        except UnicodeEncodeError:
-            # More conservative approach - only remove problematic characters
-            clean_chars = []
-            for char in text:
-                try:
-                    char.encode('latin-1')
-                    clean_chars.append(char)
-                except UnicodeEncodeError:
-                    # Replace individual problematic characters
-                    if ord(char) > 255:
-                        clean_chars.append('[?]')  # Replace with placeholder
-                    else:
-                        clean_chars.append(char)
-            
-            return ''.join(clean_chars)
-
-    # Enhanced PDF Generator method for Elevation Analysis with GPS Coordinates Table
-    # Add these methods to your existing EnhancedRoutePDF class in utils/pdf_generator.py
+        return _clean_text(text)
 
-class EnhancedRoutePDF(FPDF):
-    # ... existing methods ...
-    
     def add_supply_customer_details_page(self, route_data, enhanced_data):
         """NEW PAGE: Supply Location & Customer Details with Geocoding"""
         self.add_page()
@@ -228,19 +901,15 @@ class EnhancedRoutePDF(FPDF):
         headers = ['Terrain Type', 'Segments', 'Percentage', 'Description']
         col_widths = [40, 30, 25, 90]
         
-        self.set_font('Arial', 'B', 9)
-        self.set_fill_color(230, 230, 230)
-        for i, (header, width) in enumerate(zip(headers, col_widths)):
-            self.set_xy(10 + sum(col_widths[:i]), self.get_y())
-            self.cell(width, 10, header, 1, 0, 'C', True)
-        self.ln(10)
+        self._emit_table_header(headers, col_widths)
         
+        col_x = list(accumulate(col_widths, initial=10))
         self.set_font('Arial', '', 9)
         self.set_fill_color(255, 255, 255)
         for row in distribution_data:
             y_pos = self.get_y()
             for i, (cell, width) in enumerate(zip(row, col_widths)):
-                self.set_xy(10 + sum(col_widths[:i]), y_pos)
+                self.set_xy(col_x[i], y_pos)
                 self.cell(width, 8, self.clean_text(str(cell)), 1, 0, 'L')
             self.ln(8)
         
@@ -254,14 +923,10 @@ class EnhancedRoutePDF(FPDF):
         segment_widths = [20, 45, 25, 25, 70]
         
         # Headers
-        self.set_font('Arial', 'B', 8)
-        self.set_fill_color(230, 230, 230)
-        for i, (header, width) in enumerate(zip(segment_headers, segment_widths)):
-            self.set_xy(10 + sum(segment_widths[:i]), self.get_y())
-            self.cell(width, 8, header, 1, 0, 'C', True)
-        self.ln(8)
+        self._emit_table_header(segment_headers, segment_widths, height=8, font=('Arial', 'B', 8))
         
         # Data rows (limit to first 20 for space)
+        segment_x = list(accumulate(segment_widths, initial=10))
         self.set_font('Arial', '', 7)
         self.set_fill_color(255, 255, 255)
         for segment in terrain_segments[:20]:
@@ -280,7 +945,7 @@ class EnhancedRoutePDF(FPDF):
             ]
             
             for i, (cell, width) in enumerate(zip(row_data, segment_widths)):
-                self.set_xy(10 + sum(segment_widths[:i]), y_pos)
+                self.set_xy(segment_x[i], y_pos)
                 self.cell(width, 6, self.clean_text(cell), 1, 0, 'L')
             self.ln(6)
         
@@ -319,12 +984,7 @@ class EnhancedRoutePDF(FPDF):
             highway_widths = [20, 60, 60, 45]
             
             # Headers
-            self.set_font('Arial', 'B', 9)
-            self.set_fill_color(230, 230, 230)
-            for i, (header, width) in enumerate(zip(highway_headers, highway_widths)):
-                self.set_xy(10 + sum(highway_widths[:i]), self.get_y())
-                self.cell(width, 10, header, 1, 0, 'C', True)
-            self.ln(10)
+            self._emit_table_header(highway_headers, highway_widths)
             
             # Data rows
             self.set_font('Arial', '', 9)
@@ -362,9 +1022,7 @@ class EnhancedRoutePDF(FPDF):
         self.set_font('Arial', '', 10)
         for i, guideline in enumerate(guidelines, 1):
             self.cell(8, 6, f"{i}.", 0, 0, 'L')
-            current_x = self.get_x()
-            current_y = self.get_y()
-            self.set_xy(current_x + 8, current_y)
+            self.set_x(self.get_x() + 8)
             self.multi_cell(170, 6, self.clean_text(guideline), 0, 'L')
             self.ln(2)
         
@@ -415,12 +1073,7 @@ class EnhancedRoutePDF(FPDF):
                 segment_widths = [35, 40, 30, 25, 55]
                 
                 # Headers
-                self.set_font('Arial', 'B', 8)
-                self.set_fill_color(255, 245, 230)
-                for i, (header, width) in enumerate(zip(segment_headers, segment_widths)):
-                    self.set_xy(10 + sum(segment_widths[:i]), self.get_y())
-                    self.cell(width, 8, header, 1, 0, 'C', True)
-                self.ln(8)
+                self._emit_table_header(segment_headers, segment_widths, height=8, fill=(255, 245, 230), font=('Arial', 'B', 8))
                 
                 # Segment data
                 self.set_font('Arial', '', 7)
@@ -470,9 +1123,7 @@ class EnhancedRoutePDF(FPDF):
             
             for i, recommendation in enumerate(recommendations, 1):
                 self.cell(8, 6, f"{i}.", 0, 0, 'L')
-                current_x = self.get_x()
-                current_y = self.get_y()
-                self.set_xy(current_x + 8, current_y)
+                self.set_x(self.get_x() + 8)
                 self.multi_cell(170, 6, self.clean_text(recommendation), 0, 'L')
                 self.ln(2)
         
@@ -530,6 +1181,64 @@ class EnhancedRoutePDF(FPDF):
         
         print("✅ Enhanced Printable Coordinates page added")
     
+    def _fetch_map_image(self, url, timeout=25, cache_key=None, min_bytes=0):
+        """Return Static Maps PNG bytes for a URL, downloading only on a cache miss
+        
+        cache_key overrides the URL as the on-disk key, so nearby requests can share an image.
+        Responses shorter than min_bytes are returned as-is but never written to the disk cache.
+        """
+        if cache_key is None:
+            cache_key = _API_KEY_PARAM.sub(r'\1', url).rstrip('?&')
+        key = hashlib.sha256(cache_key.encode('utf-8')).hexdigest()
+        cache_path = self._map_image_cache_dir / f"{key}.png"
+        meta_path = cache_path.with_suffix('.json')
+        
+        try:
+            age = time.time() - cache_path.stat().st_mtime
+        except OSError:
+            age = None  # Not cached yet
+        
+        if age is not None and age < MAP_IMAGE_CACHE_MAX_AGE:
+            return cache_path.read_bytes()
+        
+        validators = {}
+        if age is not None:
+            try:
+                validators = json.loads(meta_path.read_text())
+            except (OSError, ValueError):
+                pass
+        
+        if validators:
+            # Expired entry: revalidate instead of downloading the same PNG again
+            headers = {}
+            if 'ETag' in validators:
+                headers['If-None-Match'] = validators['ETag']
+            if 'Last-Modified' in validators:
+                headers['If-Modified-Since'] = validators['Last-Modified']
+            
+            response = self.session.get(url, headers=headers, timeout=timeout)
+            if response.status_code == 304:
+                os.utime(cache_path)  # Confirmed current; restart the 30-day window
+                return cache_path.read_bytes()
+            if response.status_code != 200:
+                return None
+            content, validators = response.content, _response_validators(response)
+        else:
+            try:
+                content, validators = _fetch_map_bytes(url, timeout, min_bytes)
+            except requests.HTTPError:
+                return None
+        
+        if len(content) < min_bytes:
+            return content
+        
+        self._map_image_cache_dir.mkdir(parents=True, exist_ok=True)
+        _atomic_write(cache_path, content)
+        if validators:
+            _atomic_write(meta_path, json.dumps(validators).encode('utf-8'))
+        
+        return content
+    
     def add_color_coded_risk_visualization_page(self, route_data, color_map_url):
         """NEW PAGE: Color-Coded Risk Visualization"""
         self.add_page()
@@ -540,16 +1249,7 @@ class EnhancedRoutePDF(FPDF):
         self.set_text_color(0, 0, 0)
         self.cell(0, 8, 'RISK COLOR CODING LEGEND', 0, 1, 'L')
         
-        legend_data = [
-            ['🔴 RED', 'EXTREME RISK', 'Blind spots >80°, extreme danger turns'],
-            ['🟠 ORANGE', 'HIGH RISK', 'Sharp turns 70-80°, significant hazards'],
-            ['🟡 YELLOW', 'MEDIUM RISK', 'Moderate turns 45-70°, caution required'],
-            ['🔵 BLUE', 'EMERGENCY SERVICES', 'Hospitals, emergency facilities'],
-            ['🟢 GREEN', 'SAFE ZONES', 'Start/end points, rest areas'],
-            ['🟤 BROWN', 'ELEVATION CHANGES', 'Significant ascents/descents']
-        ]
-        
-        self.create_simple_table(legend_data, [25, 35, 125])
+        self.create_simple_table(_RISK_LEGEND_ROWS, [25, 35, 125])
         
         # Add the color-coded map if URL is provided
         if color_map_url:
@@ -558,16 +1258,9 @@ class EnhancedRoutePDF(FPDF):
             self.cell(0, 8, 'COLOR-CODED ROUTE MAP', 0, 1, 'L')
             
             try:
-                # Download and add the map image
-                import requests
-                import tempfile
-                
-                response = requests.get(color_map_url, timeout=20)
-                if response.status_code == 200:
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp:
-                        temp.write(response.content)
-                        temp_path = temp.name
-                    
+                # Download (or reuse the cached copy of) the map image
+                map_image = self._fetch_map_image(color_map_url, timeout=20)
+                if map_image:
                     # Add image to PDF
                     current_y = self.get_y()
                     img_width = 180
@@ -584,47 +1277,39 @@ class EnhancedRoutePDF(FPDF):
                     self.rect(x_position - 2, current_y - 2, img_width + 4, img_height + 4, 'D')
                     
                     # Add image
-                    self.image(temp_path, x=x_position, y=current_y, w=img_width, h=img_height)
+                    self.image(io.BytesIO(map_image), x=x_position, y=current_y, w=img_width, h=img_height)
                     
-                    os.unlink(temp_path)
                     self.set_y(current_y + img_height + 10)
                     
-                    print("✅ Multi-layer map added successfully")
+                    print("✅ Color-coded map image added successfully")
                 else:
                     self.set_font('Arial', '', 10)
-                    self.cell(0, 6, 'Multi-layer map could not be generated. Check API connectivity.', 0, 1, 'L')
+                    self.cell(0, 6, 'Color-coded map could not be generated. Check API connectivity.', 0, 1, 'L')
                     
             except Exception as e:
-                print(f"Error adding multi-layer map: {e}")
+                print(f"Error adding color-coded map: {e}")
                 self.set_font('Arial', '', 10)
                 self.cell(0, 6, f'Map generation error: {str(e)}', 0, 1, 'L')
         
-        # Layer Statistics
-        self.ln(5)
-        self.set_font('Arial', 'B', 12)
-        self.cell(0, 8, 'LAYER DATA STATISTICS', 0, 1, 'L')
-        
-        # Count data for each layer
-        sharp_turns = len(route_data.get('sharp_turns', []))
-        hospitals = len(route_data.get('hospitals', {}))
-        elevation_points = len(route_data.get('elevation', []))
-        total_pois = sum([
-            len(route_data.get('petrol_bunks', {})),
-            len(route_data.get('schools', {})),
-            len(route_data.get('food_stops', {}))
-        ])
-        
-        layer_stats = [
-            ['Risk Points (Sharp Turns)', str(sharp_turns), 'Marked with severity color coding'],
-            ['Emergency Services', str(hospitals), 'Hospitals and medical facilities'],
-            ['Elevation Change Points', str(elevation_points), 'Significant gradient changes'],
-            ['Points of Interest', str(total_pois), 'Fuel, food, and service locations'],
-            ['Total Route Points', str(route_data.get('total_points', 0)), 'Complete GPS coordinate coverage']
-        ]
-        
-        self.create_simple_table(layer_stats, [50, 25, 110])
+        # Risk Statistics
+        sharp_turns = route_data.get('sharp_turns', [])
+        if sharp_turns:
+            self.ln(5)
+            self.set_font('Arial', 'B', 12)
+            self.cell(0, 8, 'RISK DISTRIBUTION STATISTICS', 0, 1, 'L')
+            
+            extreme_risk, high_risk, medium_risk = _risk_bucket_counts(sharp_turns, angles=self._turn_angles(sharp_turns))
+            
+            risk_stats = [
+                ['Extreme Risk Points (Red)', str(extreme_risk), 'Require CRAWL SPEED 15-20 km/h'],
+                ['High Risk Points (Orange)', str(high_risk), 'Require SLOW SPEED 25-30 km/h'],
+                ['Medium Risk Points (Yellow)', str(medium_risk), 'Require CAUTION and reduced speed'],
+                ['Total Risk Points', str(len(sharp_turns)), 'Individual analysis pages included']
+            ]
+            
+            self.create_simple_table(risk_stats, [50, 25, 110])
         
-        print("✅ Multi-Layer Maps page added")
+        print("✅ Color-Coded Risk Visualization page added")
     
     # Helper methods for the new pages
     def classify_area_type(self, place_types):
@@ -676,12 +1361,7 @@ class EnhancedRoutePDF(FPDF):
             return
         
         # Headers
-        self.set_font('Arial', 'B', 8)
-        self.set_fill_color(230, 230, 230)
-        for i, (header, width) in enumerate(zip(headers, widths)):
-            self.set_xy(10 + sum(widths[:i]), self.get_y())
-            self.cell(width, 8, header, 1, 0, 'C', True)
-        self.ln(8)
+        self._emit_table_header(headers, widths, height=8, font=('Arial', 'B', 8))
         
         # Data rows
         self.set_font('Arial', '', 7)
@@ -691,16 +1371,14 @@ class EnhancedRoutePDF(FPDF):
             if self.get_y() > 270:
                 break
                 
-            y_pos = self.get_y()
-            
-            for i, (field_key, width) in enumerate(zip(field_keys, widths)):
-                value = str(row.get(field_key, ''))
-                # Truncate long values
-                if len(value) > width // 3:
-                    value = value[:width//3] + '...'
-                
-                self.set_xy(10 + sum(widths[:i]), y_pos)
-                self.cell(width, 6, self.clean_text(value), 1, 0, 'L')
+            # cell() advances x by its width, so only the row start is positioned
+            self.set_x(10)
+            for field_key, width in zip(field_keys, widths):
+                value = row.get(field_key)
+                # Most cells are already strings; skip str() for them
+                if type(value) is not str:
+                    value = '' if value is None else str(value)
+                self.cell(width, 6, self.clean_text(_trunc(value, width // 3)), 1, 0, 'L')
             self.ln(6)
         
         if len(table_data) > max_rows:
@@ -715,48 +1393,64 @@ class EnhancedRoutePDF(FPDF):
         
         try:
             # Import the new enhancement module
-            from utils.google_maps_enhancements import GoogleMapsEnhancements
+            from utils.google_maps_enhancements_v1 import GoogleMapsEnhancements
             
             # Initialize enhancer
-            enhancer = GoogleMapsEnhancements(api_key)
+            enhancer = GoogleMapsEnhancements(api_key, session=self.session)
             
-            print("🗺️ Starting Google Maps API Enhancements Integration...")
-            
-            # 1. Supply & Customer Details Enhancement
-            enhanced_supply_customer = enhancer.enhance_route_with_supply_customer_details(
-                route_data, 
-                supply_location="Supply Location", 
-                customer_name="Customer Destination"
-            )
-            self.add_supply_customer_details_page(route_data, enhanced_supply_customer)
-            
-            # 2. Terrain Classification
-            terrain_analysis = enhancer.classify_route_terrain(route_data.get('route_points', []))
-            self.add_terrain_classification_page(terrain_analysis)
-            
-            # 3. Major Highways Identification
-            highway_analysis = enhancer.identify_major_highways(route_data)
-            self.add_major_highways_page(highway_analysis)
-            
-            # 4. Time-Specific Congestion Analysis
-            congestion_analysis = enhancer.analyze_time_specific_congestion(route_data.get('route_points', []))
-            self.add_time_specific_congestion_page(congestion_analysis)
+            route_points = route_data.get('route_points', [])
+            if len(route_points) < 2:
+                print("⚠️ Skipping Google Maps API enhancements: insufficient route points")
+                return False
             
-            # 5. Enhanced Elevation Analysis
-            elevation_enhancement = enhancer.enhanced_elevation_analysis(route_data.get('route_points', []))
-            # This would integrate with your existing elevation analysis
+            print("🗺️ Starting Google Maps API Enhancements Integration...")
             
-            # 6. Printable Coordinate Tables
-            printable_tables = enhancer.generate_printable_coordinate_tables(route_data)
-            self.add_enhanced_printable_coordinates_page(printable_tables)
+            # The eight API calls are independent and network-bound, so run them
+            # concurrently; pages are still rendered here because FPDF is not thread-safe
+            tasks = {
+                'supply_customer': lambda: enhancer.enhance_route_with_supply_customer_details(
+                    route_data, 
+                    supply_location="Supply Location", 
+                    customer_name="Customer Destination"
+                ),
+                'terrain': lambda: enhancer.classify_route_terrain(route_points),
+                'highways': lambda: enhancer.identify_major_highways(route_data),
+                'congestion': lambda: enhancer.analyze_time_specific_congestion(route_points),
+                'elevation': lambda: enhancer.enhanced_elevation_analysis(route_points),
+                'printable_tables': lambda: enhancer.generate_printable_coordinate_tables(route_data),
+                'color_map': lambda: enhancer.generate_color_coded_risk_map(route_data),
+                'layered_map': lambda: enhancer.create_risk_emergency_elevation_layers(route_data)
+            }
             
-            # 7. Color-Coded Risk Visualization
-            color_map_url = enhancer.generate_color_coded_risk_map(route_data)
-            self.add_color_coded_risk_visualization_page(route_data, color_map_url)
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = {name: executor.submit(fn) for name, fn in tasks.items()}
+            
+            # Pages in report order (enhanced elevation data feeds the existing elevation page)
+            pages = [
+                ('supply_customer', "Supply & Customer Location Details",
+                 lambda result: self.add_supply_customer_details_page(route_data, result)),
+                ('terrain', "Terrain Classification Analysis", self.add_terrain_classification_page),
+                ('highways', "Major Highways Identification", self.add_major_highways_page),
+                ('congestion', "Time-Specific Congestion Mapping", self.add_time_specific_congestion_page),
+                ('elevation', "Enhanced Elevation Analysis", None),
+                ('printable_tables', "Printable GPS Coordinate Tables", self.add_enhanced_printable_coordinates_page),
+                ('color_map', "Color-Coded Risk Visualization",
+                 lambda result: self.add_color_coded_risk_visualization_page(route_data, result)),
+                ('layered_map', "Multi-Layer Route Maps",
+                 lambda result: self.add_layered_maps_page(route_data, result))
+            ]
             
-            # 8. Multi-Layer Maps
-            layered_map_url = enhancer.create_risk_emergency_elevation_layers(route_data)
-            self.add_layered_maps_page(route_data, layered_map_url)
+            for name, feature, add_page in pages:
+                try:
+                    result = futures[name].result()
+                except Exception as e:
+                    print(f"❌ Google Maps enhancement '{feature}' failed: {e}")
+                    if add_page:
+                        self.add_enhancement_unavailable_page(feature, e)
+                    continue
+                
+                if add_page:
+                    add_page(result)
             
             print("✅ All Google Maps API enhancements integrated successfully!")
             print("📄 Added 8 new PDF pages covering all JMP missing features")
@@ -778,22 +1472,11 @@ class EnhancedRoutePDF(FPDF):
         self.add_page()
         self.add_section_header("GOOGLE MAPS API ENHANCEMENTS - PLACEHOLDER", "info")
         
-        missing_features = [
-            "Supply & Customer Location Details",
-            "Terrain Classification Analysis", 
-            "Major Highways Identification",
-            "Time-Specific Congestion Mapping",
-            "Enhanced Elevation Analysis",
-            "Printable GPS Coordinate Tables",
-            "Color-Coded Risk Visualization", 
-            "Multi-Layer Route Maps"
-        ]
-        
         self.set_font('Arial', '', 10)
         self.cell(0, 8, 'The following Google Maps API enhancements are available:', 0, 1, 'L')
         self.ln(5)
         
-        for i, feature in enumerate(missing_features, 1):
+        for i, feature in enumerate(_PLACEHOLDER_FEATURES, 1):
             self.cell(8, 6, f"{i}.", 0, 0, 'L')
             self.cell(0, 6, self.clean_text(feature), 0, 1, 'L')
         
@@ -804,53 +1487,20 @@ class EnhancedRoutePDF(FPDF):
         
         self.set_font('Arial', '', 10)
         self.set_text_color(0, 0, 0)
-        instructions = [
-            "1. Create utils/google_maps_enhancements.py with the GoogleMapsEnhancements class",
-            "2. Ensure Google Maps API key is properly configured",
-            "3. Update your generate_pdf function to call integrate_google_maps_enhancements()",
-            "4. All 9 missing JMP features will be automatically added to your PDF reports"
-        ]
-        
-        for instruction in instructions:
+        for instruction in _PLACEHOLDER_INSTRUCTIONS:
             self.multi_cell(0, 6, self.clean_text(instruction), 0, 'L')
-            self.ln(2)x_position, y=current_y, w=img_width, h=img_height)
-                    
-                    import os
-                    os.unlink(temp_path)
-                    
-                    self.set_y(current_y + img_height + 10)
-                    
-                    print("✅ Color-coded map image added successfully")
-                else:
-                    self.set_font('Arial', '', 10)
-                    self.cell(0, 6, 'Color-coded map could not be generated. Check API connectivity.', 0, 1, 'L')
-                    
-            except Exception as e:
-                print(f"Error adding color-coded map: {e}")
-                self.set_font('Arial', '', 10)
-                self.cell(0, 6, f'Map generation error: {str(e)}', 0, 1, 'L')
-        
-        # Risk Statistics
-        sharp_turns = route_data.get('sharp_turns', [])
-        if sharp_turns:
-            self.ln(5)
-            self.set_font('Arial', 'B', 12)
-            self.cell(0, 8, 'RISK DISTRIBUTION STATISTICS', 0, 1, 'L')
-            
-            extreme_risk = len([t for t in sharp_turns if t.get('angle', 0) > 80])
-            high_risk = len([t for t in sharp_turns if 70 <= t.get('angle', 0) <= 80])
-            medium_risk = len([t for t in sharp_turns if 45 <= t.get('angle', 0) < 70])
-            
-            risk_stats = [
-                ['Extreme Risk Points (Red)', str(extreme_risk), 'Require CRAWL SPEED 15-20 km/h'],
-                ['High Risk Points (Orange)', str(high_risk), 'Require SLOW SPEED 25-30 km/h'],
-                ['Medium Risk Points (Yellow)', str(medium_risk), 'Require CAUTION and reduced speed'],
-                ['Total Risk Points', str(len(sharp_turns)), 'Individual analysis pages included']
-            ]
-            
-            self.create_simple_table(risk_stats, [50, 25, 110])
+            self.ln(2)
+    
+    def add_enhancement_unavailable_page(self, feature, error):
+        """Add a placeholder page for a single Google Maps enhancement whose API call failed"""
+        self.add_page()
+        self.add_section_header(f"{feature.upper()} - UNAVAILABLE", "info")
         
-        print("✅ Color-Coded Risk Visualization page added")
+        self.set_font('Arial', '', 10)
+        self.set_text_color(0, 0, 0)
+        self.multi_cell(0, 6, self.clean_text(
+            f"{feature} could not be generated for this report. "
+            f"The Google Maps API request failed: {error}"), 0, 'L')
     
     def add_layered_maps_page(self, route_data, layered_map_url):
         """NEW PAGE: Risk/Emergency/Elevation Layers"""
@@ -879,16 +1529,8 @@ class EnhancedRoutePDF(FPDF):
             self.cell(0, 8, 'COMPREHENSIVE MULTI-LAYER MAP', 0, 1, 'L')
             
             try:
-                import requests
-                import tempfile
-                import os
-                
-                response = requests.get(layered_map_url, timeout=25)
-                if response.status_code == 200:
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp:
-                        temp.write(response.content)
-                        temp_path = temp.name
-                    
+                map_image = self._fetch_map_image(layered_map_url)
+                if map_image:
                     current_y = self.get_y()
                     img_width = 180
                     img_height = 130
@@ -905,7 +1547,47 @@ class EnhancedRoutePDF(FPDF):
                     self.rect(x_position - 3, current_y - 3, img_width + 6, img_height + 6, 'D')
                     
                     # Add image
-                    self.image(temp_path, x=
+                    self.image(io.BytesIO(map_image), x=x_position, y=current_y, w=img_width, h=img_height)
+                    self.set_line_width(0.2)
+                    
+                    self.set_y(current_y + img_height + 10)
+                    
+                    print("✅ Multi-layer map added successfully")
+                else:
+                    self.set_font('Arial', '', 10)
+                    self.cell(0, 6, 'Multi-layer map could not be generated. Check API connectivity.', 0, 1, 'L')
+                    
+            except Exception as e:
+                print(f"Error adding multi-layer map: {e}")
+                self.set_font('Arial', '', 10)
+                self.cell(0, 6, f'Map generation error: {str(e)}', 0, 1, 'L')
+        
+        # Layer Statistics
+        self.ln(5)
+        self.set_font('Arial', 'B', 12)
+        self.cell(0, 8, 'LAYER DATA STATISTICS', 0, 1, 'L')
+        
+        # Count data for each layer
+        sharp_turns = len(route_data.get('sharp_turns', []))
+        hospitals = len(route_data.get('hospitals', {}))
+        elevation_points = len(route_data.get('elevation', []))
+        total_pois = sum([
+            len(route_data.get('petrol_bunks', {})),
+            len(route_data.get('schools', {})),
+            len(route_data.get('food_stops', {}))
+        ])
+        
+        layer_stats = [
+            ['Risk Points (Sharp Turns)', str(sharp_turns), 'Marked with severity color coding'],
+            ['Emergency Services', str(hospitals), 'Hospitals and medical facilities'],
+            ['Elevation Change Points', str(elevation_points), 'Significant gradient changes'],
+            ['Points of Interest', str(total_pois), 'Fuel, food, and service locations'],
+            ['Total Route Points', str(route_data.get('total_points', 0)), 'Complete GPS coordinate coverage']
+        ]
+        
+        self.create_simple_table(layer_stats, [50, 25, 110])
+        
+        print("✅ Multi-Layer Maps page added")
     # Add this method to your EnhancedRoutePDF class in utils/pdf_generator.py
 
     def add_elevation_analysis_page(self, route_data, api_key=None):
@@ -913,9 +1595,14 @@ class EnhancedRoutePDF(FPDF):
         if not ElevationAnalyzer:
             return
         
+        route_points = route_data.get('route_points', [])
+        if len(route_points) < 2:
+            print("⚠️ Skipping elevation analysis: insufficient route points")
+            return
+        
         try:
             analyzer = ElevationAnalyzer(api_key)
-            analysis = analyzer.analyze_route_elevation(route_data.get('route_points', []))
+            analysis = analyzer.analyze_route_elevation(route_points)
             
             if 'error' in analysis:
                 return
@@ -948,42 +1635,27 @@ class EnhancedRoutePDF(FPDF):
                 # Headers for summary table
                 summary_headers = ['Description', 'GPS Coordinates', 'Elevation (m)', 'Distance (km)', 'Significance']
                 summary_col_widths = [35, 45, 25, 25, 55]
-                
-                # Header row
-                self.set_font('Arial', 'B', 9)
-                self.set_fill_color(230, 230, 230)
-                self.set_text_color(0, 0, 0)
-                
-                for i, (header, width) in enumerate(zip(summary_headers, summary_col_widths)):
-                    self.set_xy(10 + sum(summary_col_widths[:i]), self.get_y())
-                    self.cell(width, 10, header, 1, 0, 'C', True)
-                self.ln(10)
+                self._emit_table_header(summary_headers, summary_col_widths)
                 
                 # Data rows
                 self.set_font('Arial', '', 8)
                 self.set_fill_color(255, 255, 255)
                 
                 for point in elevation_summary_table:
-                    y_pos = self.get_y()
-                    
                     # Description
-                    self.set_xy(10, y_pos)
+                    self.set_x(10)
                     self.cell(35, 8, self.clean_text(point['description']), 1, 0, 'L')
                     
                     # GPS Coordinates
-                    self.set_xy(45, y_pos)
                     self.cell(45, 8, point['gps_coordinates'], 1, 0, 'C')
                     
                     # Elevation
-                    self.set_xy(90, y_pos)
                     self.cell(25, 8, f"{point['elevation_meters']}", 1, 0, 'C')
                     
                     # Distance
-                    self.set_xy(115, y_pos)
                     self.cell(25, 8, f"{point['distance_km']}", 1, 0, 'C')
                     
                     # Significance
-                    self.set_xy(140, y_pos)
                     self.cell(55, 8, self.clean_text(point['significance'][:20]), 1, 0, 'L')
                     
                     self.ln(8)
@@ -992,91 +1664,52 @@ class EnhancedRoutePDF(FPDF):
             self.add_page()  # New page for detailed table
             self.add_section_header("COMPREHENSIVE GPS COORDINATES & ELEVATION TABLE", "primary")
             
-            gps_elevation_table = analysis.get('gps_elevation_table', [])
-            if gps_elevation_table:
+            gps_rows = analysis.get('gps_elevation_table', [])
+            total_points = len(gps_rows)
+            
+            if total_points:
                 # Table headers
                 headers = ['S.No', 'GPS Coordinates', 'Elevation (m)', 'Distance (km)', 'Gradient (%)', 'Category']
                 col_widths = [15, 50, 25, 25, 25, 45]
+                self._emit_body_table_header(headers, col_widths)
                 
-                # Header row
-                self.set_font('Arial', 'B', 9)
-                self.set_fill_color(230, 230, 230)
-                self.set_text_color(0, 0, 0)
-                
-                for i, (header, width) in enumerate(zip(headers, col_widths)):
-                    self.set_xy(10 + sum(col_widths[:i]), self.get_y())
-                    self.cell(width, 10, header, 1, 0, 'C', True)
-                self.ln(10)
-                
-                # Data rows (limit to first 30 points per page for space management)
-                self.set_font('Arial', '', 8)
-                self.set_fill_color(255, 255, 255)
-                
+                # Data rows (at most 30 points per page for space management)
                 points_per_page = 30
-                total_points = len(gps_elevation_table)
+                rows_this_page = 0
                 
-                for page_start in range(0, total_points, points_per_page):
-                    if page_start > 0:
+                for idx, point in enumerate(gps_rows):
+                    # Start a continuation page when this one is full or out of room
+                    if rows_this_page == points_per_page or self.get_y() > 270:
                         self.add_page()
-                        self.add_section_header(f"GPS COORDINATES TABLE (Continued - Points {page_start+1}-{min(page_start+points_per_page, total_points)})", "primary")
-                        
-                        # Repeat headers
-                        self.set_font('Arial', 'B', 9)
-                        self.set_fill_color(230, 230, 230)
-                        for i, (header, width) in enumerate(zip(headers, col_widths)):
-                            self.set_xy(10 + sum(col_widths[:i]), self.get_y())
-                            self.cell(width, 10, header, 1, 0, 'C', True)
-                        self.ln(10)
-                        self.set_font('Arial', '', 8)
-                        self.set_fill_color(255, 255, 255)
+                        self.add_section_header(f"GPS COORDINATES TABLE (Continued - Points {idx+1}-{min(idx+points_per_page, total_points)})", "primary")
+                        self._emit_body_table_header(headers, col_widths)
+                        rows_this_page = 0
                     
-                    page_end = min(page_start + points_per_page, total_points)
+                    # Color code based on risk level
+                    self.set_text_color(*_RISK_RGB.get(point.get('risk_level', 'LOW'), _RISK_RGB['LOW']))
                     
-                    for point in gps_elevation_table[page_start:page_end]:
-                        if self.get_y() > 270:  # Check for page overflow
-                            break
-                        
-                        y_pos = self.get_y()
-                        
-                        # Color code based on risk level
-                        risk_level = point.get('risk_level', 'LOW')
-                        if risk_level == 'CRITICAL':
-                            self.set_text_color(220, 53, 69)  # Red
-                        elif risk_level == 'HIGH':
-                            self.set_text_color(253, 126, 20)  # Orange
-                        elif risk_level == 'MEDIUM':
-                            self.set_text_color(108, 117, 125)  # Gray
-                        else:
-                            self.set_text_color(0, 0, 0)  # Black
-                        
-                        # S.No
-                        self.set_xy(10, y_pos)
-                        self.cell(15, 8, str(point['s_no']), 1, 0, 'C')
-                        
-                        # GPS Coordinates
-                        self.set_xy(25, y_pos)
-                        coords_text = point['gps_coordinates'][:20] + '...' if len(point['gps_coordinates']) > 20 else point['gps_coordinates']
-                        self.cell(50, 8, coords_text, 1, 0, 'C')
-                        
-                        # Elevation
-                        self.set_xy(75, y_pos)
-                        self.cell(25, 8, f"{point['elevation_meters']}", 1, 0, 'C')
-                        
-                        # Distance
-                        self.set_xy(100, y_pos)
-                        self.cell(25, 8, f"{point['distance_km']}", 1, 0, 'C')
-                        
-                        # Gradient
-                        self.set_xy(125, y_pos)
-                        gradient_text = f"{point['gradient_percent']:+.1f}"  # Show + or - sign
-                        self.cell(25, 8, gradient_text, 1, 0, 'C')
-                        
-                        # Category
-                        self.set_xy(150, y_pos)
-                        category = point['category'][:15] + '...' if len(point['category']) > 15 else point['category']
-                        self.cell(45, 8, self.clean_text(category), 1, 0, 'L')
-                        
-                        self.ln(8)
+                    # S.No
+                    self.set_x(10)
+                    self.cell(15, 8, str(point['s_no']), 1, 0, 'C')
+                    
+                    # GPS Coordinates
+                    self.cell(50, 8, _trunc(point['gps_coordinates'], 20), 1, 0, 'C')
+                    
+                    # Elevation
+                    self.cell(25, 8, f"{point['elevation_meters']}", 1, 0, 'C')
+                    
+                    # Distance
+                    self.cell(25, 8, f"{point['distance_km']}", 1, 0, 'C')
+                    
+                    # Gradient
+                    gradient_text = f"{point['gradient_percent']:+.1f}"  # Show + or - sign
+                    self.cell(25, 8, gradient_text, 1, 0, 'C')
+                    
+                    # Category
+                    self.cell(45, 8, self.clean_text(_trunc(point['category'], 15)), 1, 0, 'L')
+                    
+                    self.ln(8)
+                    rows_this_page += 1
             
             # Reset text color
             self.set_text_color(0, 0, 0)
@@ -1087,88 +1720,22 @@ class EnhancedRoutePDF(FPDF):
             
             critical_points = analysis.get('critical_elevation_points', {})
             
+            # Steep climb and descent tables share one layout
+            climb_headers = ['S.No', 'GPS Location', 'Elevation (m)', 'Distance (km)', 'Gradient (%)']
+            climb_widths = [15, 50, 25, 25, 25]
+            
             # Steep Climbs
             steep_climbs = critical_points.get('steep_climbs', [])
             if steep_climbs:
-                self.set_font('Arial', 'B', 12)
-                self.set_text_color(220, 53, 69)
-                self.cell(0, 8, f'CRITICAL: {len(steep_climbs)} STEEP CLIMB SECTIONS', 0, 1, 'L')
-                self.set_text_color(0, 0, 0)
-                
-                # Create table for steep climbs
-                climb_headers = ['S.No', 'GPS Location', 'Elevation (m)', 'Distance (km)', 'Gradient (%)']
-                climb_widths = [15, 50, 25, 25, 25]
-                
-                self.set_font('Arial', 'B', 9)
-                self.set_fill_color(255, 230, 230)  # Light red background
-                for i, (header, width) in enumerate(zip(climb_headers, climb_widths)):
-                    self.set_xy(10 + sum(climb_widths[:i]), self.get_y())
-                    self.cell(width, 8, header, 1, 0, 'C', True)
-                self.ln(8)
-                
-                self.set_font('Arial', '', 8)
-                self.set_fill_color(255, 255, 255)
-                
-                for idx, climb in enumerate(steep_climbs[:10], 1):  # Show top 10
-                    y_pos = self.get_y()
-                    
-                    self.set_xy(10, y_pos)
-                    self.cell(15, 6, str(idx), 1, 0, 'C')
-                    
-                    self.set_xy(25, y_pos)
-                    self.cell(50, 6, climb['gps'][:20], 1, 0, 'C')
-                    
-                    self.set_xy(75, y_pos)
-                    self.cell(25, 6, f"{climb['elevation']}", 1, 0, 'C')
-                    
-                    self.set_xy(100, y_pos)
-                    self.cell(25, 6, f"{climb['distance']}", 1, 0, 'C')
-                    
-                    self.set_xy(125, y_pos)
-                    self.cell(25, 6, f"+{climb['gradient']:.1f}", 1, 0, 'C')
-                    
-                    self.ln(6)
-                
+                self._render_gradient_table(f'CRITICAL: {len(steep_climbs)} STEEP CLIMB SECTIONS',
+                                            steep_climbs[:10], climb_headers, climb_widths, '+')  # Show top 10
                 self.ln(5)
             
-            # Steep Descents
+            # Steep Descents (negative sign comes from the gradient itself)
             steep_descents = critical_points.get('steep_descents', [])
             if steep_descents:
-                self.set_font('Arial', 'B', 12)
-                self.set_text_color(220, 53, 69)
-                self.cell(0, 8, f'WARNING: {len(steep_descents)} STEEP DESCENT SECTIONS', 0, 1, 'L')
-                self.set_text_color(0, 0, 0)
-                
-                # Create table for steep descents (similar structure)
-                self.set_font('Arial', 'B', 9)
-                self.set_fill_color(255, 230, 230)
-                for i, (header, width) in enumerate(zip(climb_headers, climb_widths)):
-                    self.set_xy(10 + sum(climb_widths[:i]), self.get_y())
-                    self.cell(width, 8, header, 1, 0, 'C', True)
-                self.ln(8)
-                
-                self.set_font('Arial', '', 8)
-                self.set_fill_color(255, 255, 255)
-                
-                for idx, descent in enumerate(steep_descents[:10], 1):
-                    y_pos = self.get_y()
-                    
-                    self.set_xy(10, y_pos)
-                    self.cell(15, 6, str(idx), 1, 0, 'C')
-                    
-                    self.set_xy(25, y_pos)
-                    self.cell(50, 6, descent['gps'][:20], 1, 0, 'C')
-                    
-                    self.set_xy(75, y_pos)
-                    self.cell(25, 6, f"{descent['elevation']}", 1, 0, 'C')
-                    
-                    self.set_xy(100, y_pos)
-                    self.cell(25, 6, f"{descent['distance']}", 1, 0, 'C')
-                    
-                    self.set_xy(125, y_pos)
-                    self.cell(25, 6, f"{descent['gradient']:.1f}", 1, 0, 'C')  # Negative gradient
-                    
-                    self.ln(6)
+                self._render_gradient_table(f'WARNING: {len(steep_descents)} STEEP DESCENT SECTIONS',
+                                            steep_descents[:10], climb_headers, climb_widths, '')
             
             # High Altitude Points
             high_altitude = critical_points.get('high_altitude', [])
@@ -1237,12 +1804,10 @@ class EnhancedRoutePDF(FPDF):
                     # Actions
                     self.set_font('Arial', '', 9)
                     self.set_text_color(0, 0, 0)
-                    for i, action in enumerate(actions[:5], 1):  # Limit to 5 actions
+                    for i, action in enumerate(map(self.clean_text, actions[:5]), 1):  # Limit to 5 actions
                         self.cell(8, 6, f'{i}.', 0, 0, 'L')
-                        current_x = self.get_x()
-                        current_y = self.get_y()
-                        self.set_xy(current_x + 8, current_y)
-                        self.multi_cell(170, 6, self.clean_text(action), 0, 'L')
+                        self.set_x(self.get_x() + 8)
+                        self.multi_cell(170, 6, action, 0, 'L')
                         self.ln(1)
                     
                     self.ln(5)
@@ -1250,20 +1815,109 @@ class EnhancedRoutePDF(FPDF):
             print("✅ Enhanced Elevation Analysis with GPS coordinates table added successfully")
             
         except Exception as e:
-            print(f"❌ Error adding enhanced elevation analysis: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error adding enhanced elevation analysis: %s", e)
 
+    def _emit_table_header(self, headers, widths, height=10, fill=(230, 230, 230), font=('Arial', 'B', 9)):
+        """Draw a bordered, filled header row starting at the left margin"""
+        x_offsets = list(accumulate(widths, initial=10))
+        
+        self.set_font(*font)
+        self.set_fill_color(*fill)
+        self.set_text_color(0, 0, 0)
+        
+        y_pos = self.get_y()
+        for i, (header, width) in enumerate(zip(headers, widths)):
+            self.set_xy(x_offsets[i], y_pos)
+            self.cell(width, height, header, 1, 0, 'C', True)
+        self.ln(height)
+    
+    def _rows_that_fit(self, row_height, last_row_y):
+        """How many fixed-height rows can still start on this page at or above last_row_y"""
+        return max(0, int((last_row_y - self.get_y()) // row_height) + 1)
+    
+    def _emit_body_table_header(self, headers, col_widths):
+        """Draw a table header row and leave the 8pt body font/white fill selected"""
+        self._emit_table_header(headers, col_widths)
+        self.set_font('Arial', '', 8)
+        self.set_fill_color(255, 255, 255)
+    
+    def _render_gradient_table(self, title, rows, headers, widths, sign_prefix):
+        """Render a red-titled steep climb/descent table of GPS points with their gradients"""
+        self.set_font('Arial', 'B', 12)
+        self.set_text_color(220, 53, 69)
+        self.cell(0, 8, title, 0, 1, 'L')
+        self.set_text_color(0, 0, 0)
+        
+        # Light red header row
+        self._emit_table_header(headers, widths, height=8, fill=(255, 230, 230))
+        
+        self.set_font('Arial', '', 8)
+        self.set_fill_color(255, 255, 255)
+        
+        for idx, row in enumerate(rows, 1):
+            self.set_x(10)
+            self.cell(15, 6, str(idx), 1, 0, 'C')
+            self.cell(50, 6, row['gps'][:20], 1, 0, 'C')
+            self.cell(25, 6, f"{row['elevation']}", 1, 0, 'C')
+            self.cell(25, 6, f"{row['distance']}", 1, 0, 'C')
+            self.cell(25, 6, f"{sign_prefix}{row['gradient']:.1f}", 1, 0, 'C')
+            self.ln(6)
+    
+    def start_emergency_prefetch(self, route_data, api_key):
+        """Run the emergency planning analysis in the background while the other pages are laid out"""
+        if not EmergencyPlanner or not api_key or self._emergency_prefetch is not None:
+            return
+        if len(route_data.get('route_points', [])) < 2:
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self._emergency_analysis, route_data, api_key)
+        executor.shutdown(wait=False)  # The submitted analysis still runs to completion
+        self._emergency_prefetch = (route_data, api_key, future)
+    
+    def _emergency_result(self, route_data, api_key):
+        """Prefetched emergency analysis for this route, or a fresh one; None if the prefetch timed out"""
+        prefetch, self._emergency_prefetch = self._emergency_prefetch, None
+        if prefetch is None or prefetch[0] is not route_data or prefetch[1] != api_key:
+            return self._emergency_analysis(route_data, api_key)
+        
+        try:
+            return prefetch[2].result(timeout=self._emergency_wait_s)
+        except FutureTimeoutError:
+            logger.warning("Emergency planning still running after %ss - leaving the page out", self._emergency_wait_s)
+            return None
+    
+    def _emergency_analysis(self, route_data, api_key):
+        """EmergencyPlanner analysis, read back from disk while the route and key are unchanged"""
+        cache_path = self._map_image_cache_dir / "emergency" / _emergency_cache_name(route_data, api_key)
+        try:
+            if time.time() - cache_path.stat().st_mtime < EMERGENCY_CACHE_MAX_AGE:
+                return json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            pass  # Not cached, expired or unreadable
+        
+        analysis = EmergencyPlanner(api_key).analyze_emergency_preparedness(route_data)
+        if 'error' not in analysis:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                _atomic_write(cache_path, json.dumps(analysis, default=str).encode('utf-8'))
+            except (OSError, ValueError) as e:
+                logger.warning("Could not cache emergency analysis: %s", e)
+        return analysis
+    
     def add_emergency_planning_page(self, route_data, api_key=None):
         """Add emergency planning page"""
         if not EmergencyPlanner or not api_key:
             return
         
+        if len(route_data.get('route_points', [])) < 2:
+            print("⚠️ Skipping emergency planning: insufficient route points")
+            return
+        
         try:
-            planner = EmergencyPlanner(api_key)
-            analysis = planner.analyze_emergency_preparedness(route_data)
+            analysis = self._emergency_result(route_data, api_key)
             
-            if 'error' in analysis:
+            if analysis is None or 'error' in analysis:
                 return
             
             self.add_page()
@@ -1314,11 +1968,12 @@ class EnhancedRoutePDF(FPDF):
                 self.set_font('Arial', 'B', 12)
                 self.cell(0, 8, 'EMERGENCY SERVICES ALONG ROUTE', 0, 1, 'L')
                 
+                service_density = emergency_services.get('service_density') or {}
                 services_data = [
-                    ['Hospitals', str(emergency_services.get('service_density', {}).get('hospitals_count', 0))],
-                    ['Police Stations', str(emergency_services.get('service_density', {}).get('police_stations_count', 0))],
-                    ['Service Centers', str(emergency_services.get('service_density', {}).get('service_centers_count', 0))],
-                    ['Service Density', emergency_services.get('service_density', {}).get('emergency_density', 'UNKNOWN')]
+                    ['Hospitals', str(service_density.get('hospitals_count', 0))],
+                    ['Police Stations', str(service_density.get('police_stations_count', 0))],
+                    ['Service Centers', str(service_density.get('service_centers_count', 0))],
+                    ['Service Density', service_density.get('emergency_density', 'UNKNOWN')]
                 ]
                 
                 self.create_simple_table(services_data, [60, 120])
@@ -1367,18 +2022,16 @@ class EnhancedRoutePDF(FPDF):
                     self.ln(2)
                     
                     # Actions
-                    self.set_font('Arial', '', 10)
                     self.set_text_color(0, 0, 0)
                     self.set_font('Arial', 'B', 10)
                     self.cell(0, 6, 'IMMEDIATE ACTIONS:', 0, 1, 'L')
                     
+                    # Font is set once for the whole list; action text is cleaned up front
                     self.set_font('Arial', '', 9)
-                    for i, action in enumerate(actions, 1):
+                    for i, action in enumerate(map(self.clean_text, actions), 1):
                         self.cell(8, 6, f'{i}.', 0, 0, 'L')
-                        current_x = self.get_x()
-                        current_y = self.get_y()
-                        self.set_xy(current_x + 8, current_y)
-                        self.multi_cell(170, 6, self.clean_text(action), 0, 'L')
+                        self.set_x(self.get_x() + 8)
+                        self.multi_cell(170, 6, action, 0, 'L')
                         self.ln(1)
                     
                     self.ln(8)
@@ -1398,11 +2051,10 @@ class EnhancedRoutePDF(FPDF):
         distance_km = self.parse_distance_to_km(route_data.get('distance', '0 km'))
         duration_str = route_data.get('duration', '0 hours')
         base_hours = self.parse_duration_to_hours(duration_str)
-        sharp_turns = route_data.get('sharp_turns', [])
+        sharp_turns = route_data.get('sharp_turns') or ()
         
         # Basic calculations
-        adjusted_hours = base_hours * 1.3  # 30% increase for heavy vehicle
-        rest_stops = max(0, int(adjusted_hours / 4.5))
+        adjusted_hours, rest_stops, fuel_needed = _hv_metrics(distance_km, base_hours)
         
         self.set_font('Arial', '', 10)
         intro_text = ("This basic analysis provides essential heavy vehicle considerations. "
@@ -1436,16 +2088,7 @@ class EnhancedRoutePDF(FPDF):
         self.set_font('Arial', 'B', 12)
         self.cell(0, 8, '2. ROAD WIDTH & SUITABILITY ASSESSMENT', 0, 1, 'L')
         
-        road_data = [
-            ['Minimum Width Required', '7.5 meters for safe operation'],
-            ['Bridge Weight Capacity', 'Manual verification required'],
-            ['Overhead Clearance', '4.2m minimum height needed'],
-            ['Assessment Status', 'Field verification recommended'],
-            ['Route Classification', 'Unknown - Google Roads API needed'],
-            ['Infrastructure Suitability', 'Cannot be determined without APIs']
-        ]
-        
-        self.create_simple_table(road_data, [70, 110])
+        self.create_simple_table(_BASIC_ROAD_ROWS, [70, 110])
         
         self.set_font('Arial', 'B', 10)
         self.set_text_color(253, 126, 20)
@@ -1459,9 +2102,7 @@ class EnhancedRoutePDF(FPDF):
         self.cell(0, 8, '3. TURNING RADIUS REQUIREMENTS', 0, 1, 'L')
         
         # Basic turning analysis using existing sharp turns data
-        impossible_turns = len([t for t in sharp_turns if t.get('angle', 0) > 90])
-        difficult_turns = len([t for t in sharp_turns if 70 <= t.get('angle', 0) <= 90])
-        caution_turns = len([t for t in sharp_turns if 45 <= t.get('angle', 0) < 70])
+        impossible_turns, difficult_turns, caution_turns = _risk_bucket_counts(sharp_turns, extreme_above=90, angles=self._turn_angles(sharp_turns))
         
         turning_data = [
             ['Total Sharp Turns Detected', str(len(sharp_turns))],
@@ -1493,9 +2134,8 @@ class EnhancedRoutePDF(FPDF):
         self.set_font('Arial', 'B', 12)
         self.cell(0, 8, '4. FUEL & RANGE PLANNING', 0, 1, 'L')
         
-        fuel_consumption = 3.5  # km/L for heavy vehicles
-        fuel_needed = distance_km / fuel_consumption if distance_km > 0 else 0
-        fuel_stations_count = len(route_data.get('petrol_bunks', {}))
+        fuel_consumption = _HV_FUEL_KM_PER_L
+        fuel_stations_count = len(route_data.get('petrol_bunks') or ())
         
         fuel_data = [
             ['Route Distance', f"{distance_km:.1f} km"],
@@ -1527,16 +2167,7 @@ class EnhancedRoutePDF(FPDF):
         self.set_font('Arial', 'B', 12)
         self.cell(0, 8, '5. LOAD DISTRIBUTION & PARKING FACILITIES', 0, 1, 'L')
         
-        load_data = [
-            ['Legal GVW Limit', '49,000 kg maximum'],
-            ['Front Axle Limit', '10,200 kg maximum'],
-            ['Rear Axle Limit', '18,500 kg maximum'],
-            ['Load Distribution', 'Weighbridge verification required'],
-            ['Truck Parking Areas', 'Manual identification needed'],
-            ['Parking Assessment', 'Google Places API required for analysis']
-        ]
-        
-        self.create_simple_table(load_data, [70, 110])
+        self.create_simple_table(_BASIC_LOAD_ROWS, [70, 110])
         
         self.set_font('Arial', 'B', 10)
         self.set_text_color(253, 126, 20)
@@ -1561,12 +2192,10 @@ class EnhancedRoutePDF(FPDF):
         ]
         
         self.set_font('Arial', '', 10)
-        for i, rec in enumerate(basic_recommendations, 1):
+        for i, rec in enumerate(map(self.clean_text, basic_recommendations), 1):
             self.cell(8, 6, f'{i}.', 0, 0, 'L')
-            current_x = self.get_x()
-            current_y = self.get_y()
-            self.set_xy(current_x + 8, current_y)
-            self.multi_cell(170, 6, self.clean_text(rec), 0, 'L')
+            self.set_x(self.get_x() + 8)
+            self.multi_cell(170, 6, rec, 0, 'L')
             self.ln(2)
         
         # API Enhancement Note
@@ -1591,33 +2220,12 @@ class EnhancedRoutePDF(FPDF):
 
     def parse_distance_to_km(self, distance_str: str) -> float:
         """Parse distance string to kilometers"""
-        try:
-            if not distance_str:
-                return 0.0
-            distance_str = distance_str.lower().replace('km', '').replace(',', '').strip()
-            return float(distance_str)
-        except:
+        match = _DISTANCE_RE.search(distance_str or '')
+        if not match:
             return 0.0
+        value = float(match.group(1).replace(',', ''))
+        return value / 1000 if (match.group(2) or '').lower() == 'm' else value
 
-    def parse_duration_to_hours(self, duration_str: str) -> float:
-        """Parse duration string to hours"""
-        try:
-            if not duration_str:
-                return 0.0
-            if "hour" in duration_str.lower():
-                parts = duration_str.lower().split()
-                for i, part in enumerate(parts):
-                    if "hour" in part and i > 0:
-                        return float(parts[i-1])
-            elif "min" in duration_str.lower():
-                parts = duration_str.lower().split()
-                for i, part in enumerate(parts):
-                    if "min" in part and i > 0:
-                        return float(parts[i-1]) / 60
-            return 0.0
-        except:
-            return 0.0    
-    
     def add_heavy_vehicle_analysis_page(self, route_data, vehicle_type="heavy_goods_vehicle"):
         """Add Heavy Vehicle Specific Analysis page using JSON configuration OR Google APIs"""
         
@@ -1629,11 +2237,11 @@ class EnhancedRoutePDF(FPDF):
             # Try Google API enhanced analysis first
             api_key = getattr(self, 'google_api_key', None)
             
-            if api_key:
+            if api_key and HeavyVehicleRouteAnalyzer is None:
+                print("⚠️ Heavy vehicle analyzer not available - using basic analysis")
+            elif api_key:
                 # Try to use Google API enhanced analysis
                 try:
-                    from utils.heavy_vehicle_analyzer import HeavyVehicleRouteAnalyzer
-                    
                     analyzer = HeavyVehicleRouteAnalyzer(api_key)
                     print("🚛 Generating Heavy Vehicle Analysis using Google APIs...")
                     
@@ -1644,8 +2252,6 @@ class EnhancedRoutePDF(FPDF):
                     else:
                         print(f"⚠️ Google API analysis failed: {analysis.get('error')}")
                 
-                except ImportError:
-                    print("⚠️ Heavy vehicle analyzer not available - using basic analysis")
                 except Exception as e:
                     print(f"⚠️ Google API heavy vehicle analysis failed: {e}")
             
@@ -1810,79 +2416,28 @@ class EnhancedRoutePDF(FPDF):
         col_widths = [15, 35, 30, 25, 25, 55]
         
         # Header row
-        self.set_font('Arial', 'B', 9)
-        self.set_fill_color(230, 230, 230)
-        self.set_text_color(0, 0, 0)
-        
-        x_start = 10
-        for i, (header, width) in enumerate(zip(headers, col_widths)):
-            self.set_xy(x_start + sum(col_widths[:i]), self.get_y())
-            self.cell(width, 10, header, 1, 0, 'C', True)
-        self.ln(10)
+        self._emit_table_header(headers, col_widths)
         
         # Data rows (limit to first 20 points for space)
         self.set_font('Arial', '', 8)
         self.set_fill_color(255, 255, 255)
         self.set_text_color(0, 0, 0)
         
-        for idx, point in enumerate(coverage_analysis[:20], 1):
+        aligns = ('C', 'C', 'C', 'C', 'C', 'L')
+        for color, cells in _prepare_coverage_rows(coverage_analysis[:20]):
             if self.get_y() > 270:
                 self.add_page()
                 self.add_section_header("NETWORK COVERAGE POINTS (Continued)", "info")
-            
-            coords = point.get('coordinates', {})
-            coverage_data = point.get('coverage_data', {})
-            quality = point.get('coverage_quality', 'unknown')
-            
-            # Get signal strength and technologies
-            signal_dbm = coverage_data.get('strongest_signal_dbm', -120)
-            technologies = coverage_data.get('available_technologies', [])
-            tech_str = ', '.join(technologies[:2]) if technologies else 'None'
+                # The section header changes font and colors; restore the table state
+                self._emit_body_table_header(headers, col_widths)
             
             # Color code based on quality
-            if quality == 'excellent':
-                self.set_text_color(40, 167, 69)  # Green
-            elif quality == 'good':
-                self.set_text_color(13, 110, 253)  # Blue
-            elif quality == 'fair':
-                self.set_text_color(253, 126, 20)  # Orange
-            elif quality == 'poor':
-                self.set_text_color(220, 53, 69)  # Red
-            elif quality == 'dead':
-                self.set_text_color(108, 117, 125)  # Gray
-            else:
-                self.set_text_color(0, 0, 0)  # Black for API failed
-            
-            y_pos = self.get_y()
-            
-            # S.No
-            self.set_xy(10, y_pos)
-            self.cell(15, 8, str(idx), 1, 0, 'C')
-            
-            # Coverage Quality
-            self.set_xy(25, y_pos)
-            quality_display = quality.replace('_', ' ').title()
-            self.cell(35, 8, quality_display, 1, 0, 'C')
-            
-            # Signal Strength
-            self.set_xy(60, y_pos)
-            signal_display = f"{signal_dbm} dBm" if signal_dbm > -120 else "No Signal"
-            self.cell(30, 8, signal_display, 1, 0, 'C')
-            
-            # Latitude
-            self.set_xy(90, y_pos)
-            lat = coords.get('lat', 0)
-            self.cell(25, 8, f"{lat:.4f}", 1, 0, 'C')
-            
-            # Longitude
-            self.set_xy(115, y_pos)
-            lng = coords.get('lng', 0)
-            self.cell(25, 8, f"{lng:.4f}", 1, 0, 'C')
-            
-            # Technologies
-            self.set_xy(140, y_pos)
-            self.cell(55, 8, self.clean_text(tech_str[:15]), 1, 0, 'L')
+            self.set_text_color(*color)
             
+            # cell() advances x by its width, so only the row start needs positioning
+            self.set_x(10)
+            for width, text, align in zip(col_widths, cells, aligns):
+                self.cell(width, 8, text, 1, 0, align)
             self.ln(8)
         
         # Reset text color
@@ -1892,52 +2447,7 @@ class EnhancedRoutePDF(FPDF):
         self.ln(5)
         self.add_section_header("NETWORK COVERAGE LEGEND", "success")
         
-        legend_headers = ['Coverage Level', 'Signal Range (dBm)', 'Description', 'Color Code']
-        legend_col_widths = [30, 35, 80, 30]
-        
-        # Legend header
-        self.set_font('Arial', 'B', 9)
-        self.set_fill_color(230, 230, 230)
-        self.set_text_color(0, 0, 0)
-        
-        for i, (header, width) in enumerate(zip(legend_headers, legend_col_widths)):
-            self.set_xy(10 + sum(legend_col_widths[:i]), self.get_y())
-            self.cell(width, 10, header, 1, 0, 'C', True)
-        self.ln(10)
-        
-        # Legend data
-        legend_data = [
-            ['Excellent', '> -70 dBm', 'Full connectivity', 'Green'],
-            ['Good', '-70 to -85 dBm', 'Reliable connectivity', 'Blue'],
-            ['Fair', '-85 to -100 dBm', 'Adequate connectivity', 'Orange'],
-            ['Poor', '-100 to -110 dBm', 'Unreliable connectivity', 'Red'],
-            ['Dead Zones', '< -110 dBm', 'No connectivity', 'Gray'],
-            ['API Failed', 'Unknown', 'Coverage data unavailable', 'Black']
-        ]
-        
-        self.set_font('Arial', '', 9)
-        self.set_fill_color(255, 255, 255)
-        
-        for level, signal_range, description, color in legend_data:
-            y_pos = self.get_y()
-            
-            # Coverage Level
-            self.set_xy(10, y_pos)
-            self.cell(30, 8, level, 1, 0, 'C')
-            
-            # Signal Range
-            self.set_xy(40, y_pos)
-            self.cell(35, 8, signal_range, 1, 0, 'C')
-            
-            # Description
-            self.set_xy(75, y_pos)
-            self.cell(80, 8, description, 1, 0, 'L')
-            
-            # Color Code
-            self.set_xy(155, y_pos)
-            self.cell(30, 8, color, 1, 0, 'C')
-            
-            self.ln(8)
+        self.create_simple_table(_COVERAGE_LEGEND_ROWS, [30, 35, 80, 30], header_row=True)
         
         # Summary
         self.ln(3)
@@ -1954,18 +2464,15 @@ class EnhancedRoutePDF(FPDF):
         self.add_section_header("Enhanced Route Overview", "primary")
         
         # Calculate statistics
-        sharp_turns = route_data.get('sharp_turns', [])
-        network_coverage = route_data.get('network_coverage', {})
+        sharp_turns = route_data.get('sharp_turns') or ()
+        network_coverage = route_data.get('network_coverage') or {}
+        dead_zones_count = len(network_coverage.get('dead_zones') or ())
+        poor_zones_count = len(network_coverage.get('poor_zones') or ())
+        weather_points_count = len(route_data.get('weather') or ())
         
-        blind_spots = len([t for t in sharp_turns if t.get('angle', 0) > 80])
-        sharp_danger = len([t for t in sharp_turns if 70 <= t.get('angle', 0) <= 80])
-        moderate_turns = len([t for t in sharp_turns if 45 <= t.get('angle', 0) < 70])
+        blind_spots, sharp_danger, moderate_turns = _risk_bucket_counts(sharp_turns, angles=self._turn_angles(sharp_turns))
         
-        safety_score = self.calculate_safety_score(
-            sharp_turns, 
-            len(network_coverage.get('dead_zones', [])),
-            len(network_coverage.get('poor_zones', []))
-        )
+        safety_score = self.calculate_safety_score(sharp_turns, dead_zones_count, poor_zones_count)
         
         # Create overview table
         self.set_font('Arial', 'B', 12)
@@ -1996,9 +2503,9 @@ class EnhancedRoutePDF(FPDF):
             ['Extreme Blind Spots (>80 degrees)', str(blind_spots), 'CRITICAL DANGER - Individual Pages Added'],
             ['Sharp Danger Turns (70-80 degrees)', str(sharp_danger), 'HIGH DANGER - Individual Pages Added'],
             ['Moderate Turns (45-70 degrees)', str(moderate_turns), 'CAUTION REQUIRED'],
-            ['Network Dead Zones', str(len(network_coverage.get('dead_zones', []))), 'NO SIGNAL'],
-            ['Poor Coverage Areas', str(len(network_coverage.get('poor_zones', []))), 'WEAK SIGNAL'],
-            ['Weather Monitoring Points', str(len(route_data.get('weather', []))), 'CONDITIONS TRACKED']
+            ['Network Dead Zones', str(dead_zones_count), 'NO SIGNAL'],
+            ['Poor Coverage Areas', str(poor_zones_count), 'WEAK SIGNAL'],
+            ['Weather Monitoring Points', str(weather_points_count), 'CONDITIONS TRACKED']
         ]
         
         self.create_simple_table(hazard_info, [50, 30, 100])
@@ -2014,34 +2521,38 @@ class EnhancedRoutePDF(FPDF):
         self.set_text_color(0, 0, 0)
         self.cell(0, 6, f'Each critical turn has a dedicated page with street view, satellite map, and safety recommendations.', 0, 1, 'C')
         
-    def create_simple_table(self, data, col_widths):
-        """Create a simple table with data"""
+    def create_simple_table(self, data, col_widths, header_row=False):
+        """Create a simple table with data; with header_row the first row is drawn as a shaded header"""
+        if header_row:
+            headers, *data = data
+            self._emit_table_header(headers, col_widths)
+        
         self.set_font('Arial', '', 10)
         self.set_text_color(0, 0, 0)
         
-        for row in data:
-            x_start = self.get_x()
-            y_start = self.get_y()
-            
-            # Check if we need a new page
-            if y_start > 260:
-                self.add_page()
-                y_start = self.get_y()
-            
-            for i, (cell, width) in enumerate(zip(row, col_widths)):
-                if i == 0:  # First column - bold
-                    self.set_font('Arial', 'B', 10)
-                    self.set_text_color(0, 0, 0)
-                else:
-                    self.set_font('Arial', '', 10)
-                    self.set_text_color(0, 0, 0)
+        # Clean the text before adding to cell
+        rows = [[self.clean_text(str(cell)[:70]) for cell in row] for row in data]
+        
+        # Rows are a fixed 8 high, so each page's share is known up front
+        start = 0
+        while True:
+            end = start + self._rows_that_fit(8, 260)
+            for cells in rows[start:end]:
+                # cell() advances x. First column bold, the rest regular
+                self.set_font('Arial', 'B', 10)
+                self.cell(col_widths[0], 8, cells[0], 1, 0, 'L')
+                self.set_font('Arial', '', 10)
+                for cell_text, width in zip(cells[1:], col_widths[1:]):
+                    self.cell(width, 8, cell_text, 1, 0, 'L')
                 
-                self.set_xy(x_start + sum(col_widths[:i]), y_start)
-                # Clean the text before adding to cell
-                cell_text = self.clean_text(str(cell)[:70])
-                self.cell(width, 8, cell_text, 1, 0, 'L')
+                self.ln(8)
             
-            self.ln(8)
+            start = end
+            if start >= len(rows):
+                break
+            self.add_page()
+            if header_row:
+                self._emit_table_header(headers, col_widths)
         
         self.ln(3)
     
@@ -2058,6 +2569,9 @@ class EnhancedRoutePDF(FPDF):
             'police_stations': ('POLICE STATIONS - Security Services', 'danger')
         }
         
+        # Sampled route geometry shared by every POI distance lookup below
+        route_radians = self._sampled_route_radians(route_points)
+        
         for poi_key, (title, color_type) in poi_categories.items():
             pois = route_data.get(poi_key, {})
             
@@ -2066,65 +2580,42 @@ class EnhancedRoutePDF(FPDF):
                 
             self.add_page()
             self.add_section_header(title, color_type)
-            
-            # Create detailed table with headers
-            headers = ['S.No', 'Name', 'Location', 'Latitude', 'Longitude', 'Distance (km)']
-            col_widths = [15, 50, 45, 25, 25, 25]
-            
-            # Header row
-            self.set_font('Arial', 'B', 9)
-            self.set_fill_color(230, 230, 230)
-            self.set_text_color(0, 0, 0)
-            
-            x_start = 10
-            for i, (header, width) in enumerate(zip(headers, col_widths)):
-                self.set_xy(x_start + sum(col_widths[:i]), self.get_y())
-                self.cell(width, 10, header, 1, 0, 'C', True)
-            self.ln(10)
-            
-            # Data rows
-            self.set_font('Arial', '', 8)
-            self.set_fill_color(255, 255, 255)
-            self.set_text_color(0, 0, 0)
-            
-            for idx, (name, location) in enumerate(pois.items(), 1):
-                # Calculate coordinates and distance (estimated)
-                lat, lng, distance = self.estimate_poi_location(name, location, route_points, idx, len(pois))
-                
-                # Check for page break
-                if self.get_y() > 270:
-                    self.add_page()
-                    self.add_section_header(f"{title} (Continued)", color_type)
-                
-                y_pos = self.get_y()
-                
-                # S.No
-                self.set_xy(10, y_pos)
-                self.cell(15, 8, str(idx), 1, 0, 'C')
-                
-                # Name (truncated if too long)
-                self.set_xy(25, y_pos)
-                name_truncated = name[:25] + '...' if len(name) > 25 else name
-                self.cell(50, 8, self.clean_text(name_truncated), 1, 0, 'L')
-                
-                # Location (truncated)
-                self.set_xy(75, y_pos)
-                location_truncated = location[:22] + '...' if len(location) > 22 else location
-                self.cell(45, 8, self.clean_text(location_truncated), 1, 0, 'L')
-                
-                # Latitude
-                self.set_xy(120, y_pos)
-                self.cell(25, 8, f"{lat:.4f}", 1, 0, 'C')
-                
-                # Longitude
-                self.set_xy(145, y_pos)
-                self.cell(25, 8, f"{lng:.4f}", 1, 0, 'C')
-                
-                # Distance
-                self.set_xy(170, y_pos)
-                self.cell(25, 8, f"{distance:.1f}", 1, 0, 'C')
+            
+            # Create detailed table with headers
+            headers = ['S.No', 'Name', 'Location', 'Latitude', 'Longitude', 'Distance (km)']
+            col_widths = [15, 50, 45, 25, 25, 25]
+            
+            # Header row, then data rows
+            self._emit_body_table_header(headers, col_widths)
+            
+            rows = []
+            for idx, (name, location) in enumerate(pois.items(), 1):
+                # Calculate coordinates and distance (estimated)
+                lat, lng, distance = self.estimate_poi_location(name, location, route_points, idx, len(pois), route_radians)
+                rows.append((str(idx), self.clean_text(_trunc(name, 25)), self.clean_text(_trunc(location, 22)),
+                             f"{lat:.4f}", f"{lng:.4f}", f"{distance:.1f}"))
+            
+            start = 0
+            while True:
+                end = start + self._rows_that_fit(8, 270)
+                for idx_text, name_text, location_text, lat_text, lng_text, distance_text in rows[start:end]:
+                    # cell() advances x by its width, so only the row start needs positioning
+                    self.set_x(10)
+                    self.cell(15, 8, idx_text, 1, 0, 'C')
+                    self.cell(50, 8, name_text, 1, 0, 'L')
+                    self.cell(45, 8, location_text, 1, 0, 'L')
+                    self.cell(25, 8, lat_text, 1, 0, 'C')
+                    self.cell(25, 8, lng_text, 1, 0, 'C')
+                    self.cell(25, 8, distance_text, 1, 0, 'C')
+                    self.ln(8)
                 
-                self.ln(8)
+                start = end
+                if start >= len(rows):
+                    break
+                self.add_page()
+                self.add_section_header(f"{title} (Continued)", color_type)
+                # The section header changes font and colors; restore the table state
+                self._emit_body_table_header(headers, col_widths)
             
             # Summary
             self.ln(3)
@@ -2171,23 +2662,13 @@ class EnhancedRoutePDF(FPDF):
             ])
             
             # CMVR Compliance
-            self.add_compliance_section("CMVR 1989 & AMENDMENT 2022 COMPLIANCE", [
-                ['Vehicle Category', 'Heavy Goods Vehicle'],
-                ['Weight Category', f'{vehicle_info.get("weight", 18000)} kg'],
-                ['License Required', 'HMV (Heavy Motor Vehicle)'],
-                ['Permit Required', 'YES - Mandatory for >12 tons'],
-                ['Training Hours Required', '80 hours'],
-                ['Medical Fitness Validity', '3 years']
-            ])
+            self.add_compliance_section("CMVR 1989 & AMENDMENT 2022 COMPLIANCE", (
+                ('Vehicle Category', 'Heavy Goods Vehicle'),
+                ('Weight Category', f'{vehicle_info.get("weight", 18000)} kg'),
+            ) + _CMVR_ROWS)
             
             # Speed Limits
-            self.add_compliance_section("APPLICABLE SPEED LIMITS", [
-                ['Urban Areas', '40 km/h'],
-                ['Near Schools', '25 km/h'],
-                ['Highways', '80 km/h'],
-                ['Rural Roads', '60 km/h'],
-                ['Night Driving', 'Reduce by 10 km/h']
-            ])
+            self.add_compliance_section("APPLICABLE SPEED LIMITS", _SPEED_LIMIT_ROWS)
             
             # AIS-140 Compliance
             self.add_page()  # New page for AIS-140 details
@@ -2200,57 +2681,34 @@ class EnhancedRoutePDF(FPDF):
             self.ln(5)
             
             # GPS Tracking requirements
-            self.add_compliance_section("GPS TRACKING REQUIREMENTS", [
-                ['Accuracy Required', '+/- 3 meters'],
-                ['Update Frequency', '10 seconds'],
-                ['Data Storage', '30 days minimum'],
-                ['Compliance Deadline', 'April 1, 2023']
-            ])
+            self.add_compliance_section("GPS TRACKING REQUIREMENTS", _GPS_TRACKING_ROWS)
             
             # Panic Button requirements
-            self.add_compliance_section("PANIC BUTTON REQUIREMENTS", [
-                ['Location', 'Driver accessible position'],
-                ['Response Time', '<5 seconds'],
-                ['Alert Recipients', 'Police, Owner, Control Center'],
-                ['Installation', 'Authorized centers only']
-            ])
+            self.add_compliance_section("PANIC BUTTON REQUIREMENTS", _PANIC_BUTTON_ROWS)
             
             # Compliance checklist
-            checklist = [
-                'GPS device installed and functional',
-                'Panic button accessible to driver', 
-                'Emergency SOS functionality active',
-                'Overspeed alert system configured',
-                'Data transmission to India-based servers',
-                'Device certification from BIS'
-            ]
-            
             self.set_font('Arial', 'B', 12)
             self.cell(0, 8, 'AIS-140 COMPLIANCE CHECKLIST:', 0, 1, 'L')
             self.set_font('Arial', '', 10)
-            for item in checklist:
-                self.cell(0, 6, f'  -{self.clean_text(item)}', 0, 1, 'L')
+            for item in _AIS140_CHECKLIST:
+                self.cell(0, 6, f'  -{item}', 0, 1, 'L')
             self.ln(5)
             
             # RTSP Compliance
             estimated_hours = self.parse_duration_to_hours(route_data.get('duration', '8 hours'))
             required_rest_stops = max(0, int(estimated_hours / 4.5))
             
-            self.add_compliance_section("ROAD TRANSPORT SAFETY POLICY (RTSP)", [
-                ['Estimated Driving Time', f'{estimated_hours:.1f} hours'],
-                ['Max Continuous Allowed', '4.5 hours'],
-                ['Daily Max Allowed', '10 hours'],
-                ['Time Compliance', 'COMPLIANT' if estimated_hours <= 10 else 'NON-COMPLIANT'],
-                ['Required Rest Stops', str(required_rest_stops)],
-                ['Rest Duration Each Stop', '45 minutes minimum']
-            ])
+            self.add_compliance_section("ROAD TRANSPORT SAFETY POLICY (RTSP)", (
+                ('Estimated Driving Time', f'{estimated_hours:.1f} hours'),
+                ('Max Continuous Allowed', '4.5 hours'),
+                ('Daily Max Allowed', '10 hours'),
+                ('Time Compliance', 'COMPLIANT' if estimated_hours <= 10 else 'NON-COMPLIANT'),
+                ('Required Rest Stops', str(required_rest_stops)),
+                ('Rest Duration Each Stop', '45 minutes minimum'),
+            ))
             
             # Night Driving Restrictions
-            self.add_compliance_section("NIGHT DRIVING RESTRICTIONS", [
-                ['Night Hours', '22:00 to 06:00'],
-                ['Speed Reduction', '10 km/h below daytime limits'],
-                ['Additional Safety', 'Enhanced lighting, fatigue monitoring required']
-            ])
+            self.add_compliance_section("NIGHT DRIVING RESTRICTIONS", _NIGHT_DRIVING_ROWS)
             
             # State Permits
             self.add_page()  # New page for state permits
@@ -2260,57 +2718,28 @@ class EnhancedRoutePDF(FPDF):
             self.cell(0, 8, 'STATES CROSSED: Delhi, Haryana (Estimated)', 0, 1, 'L')
             self.ln(3)
             
-            critical_permits = [
-                'Inter-State Permit (Mandatory)',
-                'Heavy Vehicle Permit',
-                'Route Permit for Commercial Vehicles',
-                'Environmental Clearance (if applicable)'
-            ]
-            
             self.set_font('Arial', 'B', 12)
             self.cell(0, 8, 'CRITICAL PERMITS REQUIRED:', 0, 1, 'L')
             self.set_font('Arial', '', 10)
-            for permit in critical_permits:
-                self.cell(0, 6, f'  - {self.clean_text(permit)}', 0, 1, 'L')
+            for permit in _CRITICAL_PERMITS:
+                self.cell(0, 6, f'  - {permit}', 0, 1, 'L')
             self.ln(5)
             
             # Recommendations
-            recommendations = [
-                'CRITICAL: Install AIS-140 compliant GPS tracking system',
-                'CRITICAL: Install panic button accessible to driver',
-                'Plan 2 mandatory rest stops (45 min each) for this journey',
-                'Obtain inter-state permits for all states',
-                'Check Delhi-specific entry requirements',
-                'Carry all vehicle documents (RC, Insurance, PUC)',
-                'Ensure driver medical fitness certificate is valid',
-                'Check vehicle safety equipment (first aid, fire extinguisher)',
-                'Verify speed governor installation and calibration',
-                'Plan route to avoid restricted time zones'
-            ]
-            
             self.add_page()  # New page for recommendations
             self.add_section_header("COMPLIANCE RECOMMENDATIONS", "info")
             
             self.set_font('Arial', '', 10)
             self.set_text_color(0, 0, 0)
             
-            for i, recommendation in enumerate(recommendations, 1):
-                # Color code recommendations by priority
-                if recommendation.startswith('CRITICAL'):
-                    self.set_text_color(220, 53, 69)  # Red for critical
-                elif recommendation.startswith('Plan'):
-                    self.set_text_color(253, 126, 20)  # Orange for time-sensitive
-                elif recommendation.startswith('Check') or recommendation.startswith('Obtain'):
-                    self.set_text_color(13, 110, 253)  # Blue for documentation
-                else:
-                    self.set_text_color(0, 0, 0)  # Black for general
+            for i, (recommendation, rgb) in enumerate(_COMPLIANCE_RECOMMENDATIONS, 1):
+                # Color coded by priority (precomputed at import)
+                self.set_text_color(*rgb)
                 
                 self.cell(8, 6, f'{i}.', 0, 0, 'L')
                 # Use multi_cell for long text with proper cleaning
-                current_x = self.get_x()
-                current_y = self.get_y()
-                self.set_xy(current_x + 8, current_y)
-                self.multi_cell(170, 6, self.clean_text(recommendation), 0, 'L')
+                self.set_x(self.get_x() + 8)
+                self.multi_cell(170, 6, recommendation, 0, 'L')
                 self.ln(2)
             
             # Reset color
@@ -2330,8 +2759,10 @@ class EnhancedRoutePDF(FPDF):
     
     def add_compliance_section(self, title, data):
         """Add a compliance section with table"""
-        # Check space and add page if needed
-        if self.get_y() > 240:
+        # Rows are a fixed 8 high under a 10 high title, so whether a table fits is known up front:
+        # tables of up to 30 rows move to a new page whole rather than splitting off a few rows
+        last_row_y = self.get_y() + 10 + 8 * (len(data) - 1)
+        if self.get_y() > 240 or (len(data) <= 30 and last_row_y > 270):
             self.add_page()
         
         self.set_font('Arial', 'B', 12)
@@ -2342,46 +2773,107 @@ class EnhancedRoutePDF(FPDF):
         col_widths = [80, 100]
         
         self.set_font('Arial', '', 10)
-        for row in data:
-            if self.get_y() > 270:
-                self.add_page()
-            
-            y_pos = self.get_y()
-            
-            # Key column (bold)
-            self.set_font('Arial', 'B', 10)
-            self.set_xy(10, y_pos)
-            self.cell(80, 8, self.clean_text(str(row[0])), 1, 0, 'L')
-            
-            # Value column
-            self.set_font('Arial', '', 10)
-            self.set_xy(90, y_pos)
-            self.cell(100, 8, self.clean_text(str(row[1])), 1, 0, 'L')
+        rows = [(self.clean_text(str(row[0])), self.clean_text(str(row[1]))) for row in data]
+        
+        start = 0
+        while True:
+            end = start + self._rows_that_fit(8, 270)
+            for key_text, value_text in rows[start:end]:
+                # Key column (bold), then value column; cell() advances x between them
+                self.set_x(10)
+                self.set_font('Arial', 'B', 10)
+                self.cell(80, 8, key_text, 1, 0, 'L')
+                self.set_font('Arial', '', 10)
+                self.cell(100, 8, value_text, 1, 0, 'L')
+                
+                self.ln(8)
             
-            self.ln(8)
+            start = end
+            if start >= len(rows):
+                break
+            self.add_page()
         
         self.ln(5)
     
     def add_individual_turn_pages(self, route_data, api_key):
         """Add individual pages for each critical turn with street view and maps"""
-        sharp_turns = route_data.get('sharp_turns', [])
+        # Critical turns (blind spots and sharp danger turns), highest angle first
+        critical_turns = self._critical_turns(route_data.get('sharp_turns'))
         
-        if not sharp_turns:
+        if not critical_turns:
             return
         
-        # Filter critical turns (blind spots and sharp danger turns)
-        critical_turns = [turn for turn in sharp_turns if turn.get('angle', 0) >= 70]
+        # Without an API key there are no maps, so one summary table replaces the per-turn pages
+        if not api_key:
+            self._emit_turns_summary_table(critical_turns)
+            return
         
-        if not critical_turns:
+        print(f"📄 Generating {len(critical_turns)} individual turn analysis pages...")
+        
+        # Usually already running since generate_pdf started it; each page waits only for its
+        # own turn's prefetch, then renders from the caches
+        self.start_turn_map_prefetch(route_data, api_key)
+        try:
+            for idx, turn in enumerate(critical_turns, 1):
+                prefetch = self._turn_prefetches.get((turn.get('lat', 0), turn.get('lng', 0)))
+                if prefetch is not None:
+                    prefetch.result()
+                self.add_single_turn_analysis_page(turn, idx, len(critical_turns), api_key)
+        finally:
+            self._stop_turn_map_prefetch()
+    
+    def start_turn_map_prefetch(self, route_data, api_key):
+        """Start downloading every critical turn's Street View and satellite maps in the background
+        
+        Turn pages come near the end of the report, so starting this first lets the downloads
+        overlap with laying out all the earlier pages.
+        """
+        if not api_key or self._prefetch_executor is not None:
             return
         
-        # Sort by danger level (highest angle first)
-        critical_turns.sort(key=lambda x: x.get('angle', 0), reverse=True)
+        critical_turns = self._critical_turns(route_data.get('sharp_turns'))
+        if not critical_turns:
+            return
         
-        print(f"📄 Generating {len(critical_turns)} individual turn analysis pages...")
+        print(f"🔄 Prefetching maps for {len(critical_turns)} critical turns in the background...")
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=4)
+        self._prefetch_stop = threading.Event()
+        for turn in critical_turns:
+            lat, lng = turn.get('lat', 0), turn.get('lng', 0)
+            self._turn_prefetches[(lat, lng)] = self._prefetch_executor.submit(
+                self._prefetch_turn_maps, lat, lng, api_key, self._prefetch_stop)
+    
+    def _stop_turn_map_prefetch(self):
+        """Cancel queued turn-map downloads and tell running ones to stop after their current request"""
+        if self._prefetch_executor is not None:
+            self._prefetch_stop.set()
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_executor = None
+        self._turn_prefetches = {}
+    
+    def _emit_turns_summary_table(self, critical_turns):
+        """Single page listing every critical turn, used when maps are unavailable"""
+        print(f"📄 Summarising {len(critical_turns)} critical turns in one table (no API key for maps)...")
+        self.add_page()
+        self.add_section_header(f"CRITICAL TURNS SUMMARY - {len(critical_turns)} TURNS", "danger")
         
+        rows = [['#', 'Angle', 'GPS Coordinates', 'Danger Level', 'Speed']]
         for idx, turn in enumerate(critical_turns, 1):
-            self.add_single_turn_analysis_page(turn, idx, len(critical_turns), api_key)
+            angle = turn.get('angle', 0)
+            extreme = angle > 80
+            rows.append([
+                idx,
+                f"{angle} deg",
+                f"{turn.get('lat', 0):.6f}, {turn.get('lng', 0):.6f}",
+                'EXTREME BLIND SPOT' if extreme else 'SHARP DANGER TURN',
+                '15-20 km/h' if extreme else '25-30 km/h'
+            ])
+        
+        self.create_simple_table(rows, [12, 25, 60, 58, 35], header_row=True)
+        
+        self.set_font('Arial', 'I', 10)
+        self.set_text_color(100, 100, 100)
+        self.cell(0, 6, 'Street View and satellite maps require Google Maps API key configuration.', 0, 1, 'L')
     
     def add_single_turn_analysis_page(self, turn, turn_number, total_turns, api_key):
         """Add detailed analysis page for a single turn"""
@@ -2439,11 +2931,9 @@ class EnhancedRoutePDF(FPDF):
         
         for i, rec in enumerate(recommendations, 1):
             self.cell(8, 6, f"{i}.", 0, 0, 'L')
-            # Use multi_cell for long text with proper cleaning
-            current_x = self.get_x()
-            current_y = self.get_y()
-            self.set_xy(current_x + 8, current_y)
-            self.multi_cell(170, 6, self.clean_text(rec), 0, 'L')
+            # Use multi_cell for long text (already cleaned at import)
+            self.set_x(self.get_x() + 8)
+            self.multi_cell(170, 6, rec, 0, 'L')
             self.ln(2)
         
         # Add maps section
@@ -2467,29 +2957,8 @@ class EnhancedRoutePDF(FPDF):
         # self.cell(180, 12, self.clean_text(warning_text), 0, 1, 'C')
     
     def get_turn_safety_recommendations(self, angle):
-        """Get safety recommendations based on turn angle"""
-        if angle > 80:
-            return [
-                "CRAWL SPEED MANDATORY: Reduce speed to 15-20 km/h minimum before entering turn",
-                "HORN WARNING: Sound horn continuously while approaching and taking the turn", 
-                "HEADLIGHTS ON: Keep headlights on during daytime for maximum visibility",
-                "AVOID OVERTAKING: Absolutely no overtaking 200m before and after this turn",
-                "STAY IN LANE: Keep to the extreme left of your lane throughout the turn",
-                "PASSENGER ALERT: Warn all passengers about the dangerous blind spot ahead",
-                "EMERGENCY PREP: Have emergency contact ready - accidents common at such turns",
-                "WEATHER CHECK: Avoid this turn in rain, fog, or night conditions if possible"
-            ]
-        else:
-            return [
-                "REDUCE SPEED: Slow down to 25-30 km/h before entering the sharp turn",
-                "USE HORN: Sound horn to alert oncoming traffic of your presence",
-                "MAINTAIN DISTANCE: Keep safe distance from vehicle ahead (minimum 50m)",
-                "PROPER LANE: Stay in correct lane and avoid cutting corners",
-                "CHECK MIRRORS: Monitor traffic behind before slowing down",
-                "GEAR DOWN: Use appropriate gear for controlled speed through turn",
-                "AVOID BRAKING: Complete braking before turn, not during the turn",
-                "POST-TURN CAUTION: Accelerate gradually after completing the turn"
-            ]
+        """Get safety recommendations based on turn angle (shared, already cleaned tuples)"""
+        return _EXTREME_TURN_RECOMMENDATIONS if angle > 80 else _SHARP_TURN_RECOMMENDATIONS
     
     def add_turn_maps_section(self, lat, lng, angle, api_key, turn_number):
         """Add street view and satellite map for the turn"""
@@ -2497,7 +2966,7 @@ class EnhancedRoutePDF(FPDF):
         self.set_text_color(0, 0, 0)
         self.cell(0, 8, 'TURN LOCATION ANALYSIS:', 0, 1, 'L')
         
-        print(f"🗺️ Adding turn maps section for turn {turn_number}")
+        logger.debug("🗺️ Adding turn maps section for turn %s", turn_number)
         self.add_dual_turn_maps(lat, lng, api_key)
     
     def add_dual_turn_maps(self, lat, lng, api_key):
@@ -2518,16 +2987,16 @@ class EnhancedRoutePDF(FPDF):
             self.ln(8)
             current_y = self.get_y()
             
-            print(f"📍 Processing turn at coordinates: {lat:.6f}, {lng:.6f}")
+            logger.debug("📍 Processing turn at coordinates: %.6f, %.6f", lat, lng)
             
             # Generate street view
-            print("🔄 Attempting to generate Street View...")
+            logger.debug("🔄 Attempting to generate Street View...")
             street_view_success = self.add_street_view_image(lat, lng, api_key, 
                                                            x_pos=10, y_pos=current_y, 
                                                            width=85, height=50)
             
             # Generate satellite map
-            print("🔄 Attempting to generate Satellite Map...")
+            logger.debug("🔄 Attempting to generate Satellite Map...")
             satellite_success = self.add_satellite_map_image(lat, lng, api_key,
                                                            x_pos=105, y_pos=current_y,
                                                            width=85, height=50)
@@ -2553,15 +3022,13 @@ class EnhancedRoutePDF(FPDF):
             
             # Debug API status
             if not street_view_success:
-                print(f"⚠️ Street View failed for {lat:.6f}, {lng:.6f}")
+                logger.warning("⚠️ Street View failed for %.6f, %.6f", lat, lng)
                 self.set_font('Arial', '', 8)
                 self.set_text_color(200, 100, 0)
                 self.cell(0, 5, 'Note: Street View may not be available for this location. Using placeholder.', 0, 1, 'C')
             
         except Exception as e:
-            print(f" Error adding dual maps: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error adding dual maps: %s", e)
             self.add_compact_turn_map(lat, lng, api_key, 'roadmap')
     
     def add_street_view_image(self, lat, lng, api_key, x_pos=10, y_pos=None, width=85, height=60):
@@ -2570,235 +3037,307 @@ class EnhancedRoutePDF(FPDF):
             if y_pos is None:
                 y_pos = self.get_y()
             
-            print(f"🔍 Generating Street View for {lat:.6f}, {lng:.6f}")
-            
-            # Try multiple headings to get street view
-            attempts = [
-                (lat, lng, 0),    # Original location, north
-                (lat, lng, 90),   # Original location, east  
-                (lat, lng, 180),  # Original location, south
-                (lat, lng, 270),  # Original location, west
-                (lat + 0.0001, lng, 0),     # Slightly north
-                (lat - 0.0001, lng, 0),     # Slightly south
-                (lat, lng + 0.0001, 0),     # Slightly east
-                (lat, lng - 0.0001, 0),     # Slightly west
-            ]
+            logger.debug("🔍 Generating Street View for %.6f, %.6f", lat, lng)
             
-            for attempt_num, (try_lat, try_lng, heading) in enumerate(attempts):
+            # Try multiple headings (then nearby points) to get street view
+            for attempt_num, try_lat, try_lng, heading, pano in self._streetview_candidates(lat, lng, api_key):
+                content = self._fetch_streetview(try_lat, try_lng, heading, api_key, attempt_num, pano)
+                if content is None:
+                    continue
+                
                 try:
-                    # Street View API with enhanced parameters
-                    base_url = "https://maps.googleapis.com/maps/api/streetview"
-                    params = [
-                        f"size=640x640",
-                        f"location={try_lat},{try_lng}",
-                        f"heading={heading}",
-                        f"pitch=5",
-                        f"fov=90",
-                        f"return_error_code=true",
-                        f"key={api_key}"
-                    ]
+                    # Add green border for street view
+                    self.set_draw_color(34, 139, 34)  # Forest green
+                    self.set_line_width(1.5)
+                    self.rect(x_pos - 1, y_pos - 1, width + 2, height + 2, 'D')
                     
-                    url = f"{base_url}?" + "&".join(params)
-                    print(f"  📡 Street View attempt {attempt_num+1}/8: {try_lat:.6f},{try_lng:.6f} heading:{heading}°")
+                    # Add image straight from the fetched bytes - no temp file round trip
+                    self.image(io.BytesIO(_downscale_image(content)), x=x_pos, y=y_pos, w=width, h=height)
                     
-                    response = requests.get(url, timeout=25)
+                    logger.debug("Street View SUCCESS! (attempt %s, heading: %s°)", attempt_num+1, heading)
                     
-                    if response.status_code == 200:
-                        content_length = len(response.content)
-                        print(f"  📊 Response size: {content_length} bytes")
-                        
-                        # Check for valid street view
-                        if content_length > 3000:  # Real street view images are much larger
-                            with tempfile.NamedTemporaryFile(delete=False, suffix='.jpg') as temp:
-                                temp.write(response.content)
-                                temp_path = temp.name
-                            
-                            try:
-                                # Add green border for street view
-                                self.set_draw_color(34, 139, 34)  # Forest green
-                                self.set_line_width(1.5)
-                                self.rect(x_pos - 1, y_pos - 1, width + 2, height + 2, 'D')
-                                
-                                # Add image
-                                self.image(temp_path, x=x_pos, y=y_pos, w=width, h=height)
-                                
-                                print(f"   Street View SUCCESS! (attempt {attempt_num+1}, heading: {heading}°)")
-                                
-                                # Add success label
-                                self.set_font('Arial', 'B', 8)
-                                self.set_text_color(34, 139, 34)
-                                self.set_xy(x_pos, y_pos + height + 1)
-                                self.cell(width, 4, f'Street View - {heading} degree view', 0, 0, 'C')
-                                
-                                os.unlink(temp_path)
-                                return True
-                                
-                            except Exception as img_error:
-                                print(f"   Image processing failed: {img_error}")
-                                try:
-                                    os.unlink(temp_path)
-                                except:
-                                    pass
-                                continue
-                        else:
-                            print(f"  ⚠️ Response too small ({content_length} bytes) - no street view at this location")
-                    else:
-                        print(f"   HTTP {response.status_code}")
-             
-                except requests.RequestException as req_error:
-                    print(f"   Request failed: {req_error}")
-                    continue
-                except Exception as e:
-                    print(f"   Attempt {attempt_num+1} failed: {e}")
+                    # Add success label
+                    self.set_font('Arial', 'B', 8)
+                    self.set_text_color(34, 139, 34)
+                    self.set_xy(x_pos, y_pos + height + 1)
+                    self.cell(width, 4, f'Street View - {heading} degree view', 0, 0, 'C')
+                    return True
+                    
+                except Exception as img_error:
+                    logger.warning("Image processing failed: %s", img_error)
                     continue
             
             # All attempts failed - add informative placeholder
-            print(f"  🚫 No Street View available after {len(attempts)} attempts")
+            logger.debug("🚫 No Street View available for %.6f, %.6f", lat, lng)
             self.add_street_view_placeholder(x_pos, y_pos, width, height, lat, lng)
             return False
             
         except Exception as e:
-            print(f" Street view critical error: {e}")
+            logger.warning("Street view critical error: %s", e)
             self.add_street_view_placeholder(x_pos, y_pos, width, height, lat, lng)
             return False
     
-    def add_street_view_placeholder(self, x_pos, y_pos, width, height, lat, lng):
-        """Add placeholder when street view is not available"""
+    def _streetview_candidates(self, lat, lng, api_key):
+        """Street View candidates for a turn, cut off once its time budget is spent or Street View
+        has been disabled for the report"""
+        if self._streetview_disabled:
+            return
+        
+        deadline = time.monotonic() + self._map_budget_s
+        for candidate in self._streetview_search(lat, lng, api_key):
+            if self._streetview_disabled:
+                return
+            if time.monotonic() > deadline:
+                logger.warning("⏰ Street View budget of %ss used up for %.6f, %.6f", self._map_budget_s, lat, lng)
+                return
+            yield candidate
+    
+    def _streetview_search(self, lat, lng, api_key):
+        """Yield (attempt_num, lat, lng, heading, pano) Street View candidates in priority order
+        
+        Street View coverage works at block scale, so when the metadata says there is no imagery
+        at the turn itself the ~11 m neighbours are not tried. The four headings at the turn use
+        its panorama id; neighbours are only probed once all of those have failed.
+        """
+        pano = self._streetview_metadata(lat, lng, api_key)
+        if pano is False:
+            logger.debug("🚫 No Street View imagery at turn - skipping nearby attempts")
+            return
+        
+        attempts = _streetview_attempts(lat, lng)
+        for attempt_num, (try_lat, try_lng, heading) in enumerate(attempts[:4]):
+            yield attempt_num, try_lat, try_lng, heading, pano or None
+        
+        available = self._streetview_availability(attempts[4:], api_key)
+        for attempt_num, (try_lat, try_lng, heading) in enumerate(attempts[4:], 4):
+            if available[(try_lat, try_lng)]:
+                yield attempt_num, try_lat, try_lng, heading, None
+    
+    def _streetview_availability(self, attempts, api_key):
+        """Map each distinct (lat, lng) in attempts to whether Street View imagery exists there
+        
+        The (free) metadata endpoint is probed concurrently so imagery is only downloaded
+        where Google reports a panorama.
+        """
+        locations = list(dict.fromkeys((try_lat, try_lng) for try_lat, try_lng, _ in attempts))
+        with ThreadPoolExecutor(max_workers=len(locations)) as executor:
+            return dict(zip(locations, executor.map(
+                lambda location: self._streetview_available(*location, api_key), locations)))
+    
+    def _streetview_available(self, lat, lng, api_key):
+        """Ask the Street View metadata endpoint whether imagery exists at a location"""
+        return self._streetview_metadata(lat, lng, api_key) is not False
+    
+    def _streetview_metadata(self, lat, lng, api_key):
+        """Street View metadata for a location: the pano_id ('' if not given) when imagery exists,
+        False when Google has none, None when the check itself failed"""
+        known = self._streetview_status.get((lat, lng))
+        if known is not None:
+            return known
+        
+        url = f"https://maps.googleapis.com/maps/api/streetview/metadata?location={lat},{lng}&key={api_key}"
         try:
-            # Draw placeholder rectangle with street view styling
-            self.set_draw_color(220, 20, 60)  # Crimson red border
-            self.set_fill_color(255, 240, 245)  # Light pink background
-            self.set_line_width(2)
-            self.rect(x_pos, y_pos, width, height, 'DF')
-            
-            # Add "NO STREET VIEW" header
-            self.set_font('Arial', 'B', 11)
-            self.set_text_color(220, 20, 60)
-            self.set_xy(x_pos, y_pos + height/2 - 25)
-            self.cell(width, 8, 'STREET VIEW', 0, 0, 'C')
-            
-            self.set_xy(x_pos, y_pos + height/2 - 15)
-            self.cell(width, 8, 'NOT AVAILABLE', 0, 0, 'C')
-            
-            # Add coordinates
-            self.set_font('Arial', '', 9)
-            self.set_text_color(100, 100, 100)
-            self.set_xy(x_pos, y_pos + height/2 - 2)
-            self.cell(width, 6, f'GPS: {lat:.6f}, {lng:.6f}', 0, 0, 'C')
-            
-            # Add helpful message
-            self.set_font('Arial', '', 8)
-            self.set_xy(x_pos, y_pos + height/2 + 8)
-            self.cell(width, 5, 'Street imagery not available', 0, 0, 'C')
-            
-            self.set_xy(x_pos, y_pos + height/2 + 16)
-            self.cell(width, 5, 'for this exact location.', 0, 0, 'C')
-            
-            self.set_xy(x_pos, y_pos + height/2 + 24)
-            self.cell(width, 5, 'Refer to satellite map.', 0, 0, 'C')
-            
-            print(f"  📋 Street View placeholder added for {lat:.4f}, {lng:.4f}")
-            
+            metadata = self.session.get(url, timeout=5).json()
+        except (requests.RequestException, ValueError) as e:
+            # Unknown availability - let the image request decide (and ask again next time)
+            logger.warning("Street View metadata check failed: %s", e)
+            return None
+        
+        status = metadata.get('status')
+        if status == 'OK':
+            result = metadata.get('pano_id') or ''
+        else:
+            logger.debug("⚠️ No Street View imagery at %.6f,%.6f (%s)", lat, lng, status)
+            result = False
+        self._streetview_status[(lat, lng)] = result
+        return result
+    
+    def _prefetch_turn_maps(self, lat, lng, api_key, stop):
+        """Warm the metadata and image caches for one turn so its page renders without waiting
+        
+        stop is set once the report is written or has failed; the remaining downloads are skipped.
+        """
+        try:
+            for attempt_num, try_lat, try_lng, heading, pano in self._streetview_candidates(lat, lng, api_key):
+                if stop.is_set():
+                    return
+                # Not _fetch_streetview: only the render thread counts failures toward the
+                # report-wide disable, so worker threads never race on the streak
+                if self._download_streetview(try_lat, try_lng, heading, api_key, attempt_num, pano):
+                    break
+            if not stop.is_set():
+                self._fetch_satellite(lat, lng, api_key)
         except Exception as e:
-            print(f"Error adding street view placeholder: {e}")
+            # Rendering fetches whatever is still missing
+            logger.warning("⚠️ Map prefetch failed for %.6f, %.6f: %s", lat, lng, e)
+    
+    def _fetch_streetview(self, try_lat, try_lng, heading, api_key, attempt_num=0, pano=None):
+        """Download one Street View candidate, tracking the report-wide run of failed downloads
+        
+        Render thread only; the streak and disable flag are not updated under a lock.
+        """
+        content = self._download_streetview(try_lat, try_lng, heading, api_key, attempt_num, pano)
+        if content is not None:
+            self._streetview_fail_streak = 0
+            return content
+        
+        self._streetview_fail_streak += 1
+        if self._streetview_fail_streak > self._streetview_max_fail_streak and not self._streetview_disabled:
+            logger.warning("🚫 %s Street View downloads failed in a row - using placeholders for the rest of this report", self._streetview_fail_streak)
+            self._streetview_disabled = True
+        return None
+    
+    def _download_streetview(self, try_lat, try_lng, heading, api_key, attempt_num=0, pano=None):
+        """Download one Street View candidate; returns the JPEG bytes or None when there is no imagery
+        
+        A known pano id pins the request to that panorama instead of a location search.
+        """
+        # Street View API with enhanced parameters
+        base_url = "https://maps.googleapis.com/maps/api/streetview"
+        params = [
+            f"size=640x640",
+            f"pano={pano}" if pano else f"location={try_lat},{try_lng}",
+            f"heading={heading}",
+            f"pitch=5",
+            f"fov=90",
+            f"return_error_code=true",
+            f"key={api_key}"
+        ]
+        
+        url = f"{base_url}?" + "&".join(params)
+        logger.debug("📡 Street View attempt %s/8: %.6f,%.6f heading:%s°", attempt_num+1, try_lat, try_lng, heading)
+        
+        # Turns on the same panorama (or within ~10 m) share one cached image per heading
+        if pano:
+            cache_key = f"streetview:pano:{pano}:{heading}"
+        else:
+            cache_key = f"streetview:{round(try_lat, 4)},{round(try_lng, 4)}:{heading}"
+        try:
+            # Placeholder "no imagery" responses are rejected on their Content-Length header
+            content = self._fetch_map_image(url, timeout=8, cache_key=cache_key, min_bytes=3001)
+        except requests.RequestException as req_error:
+            logger.warning("Request failed: %s", req_error)
+            return None
+        
+        if content is None:
+            logger.warning("Street View HTTP error")
+            return None
+        
+        content_length = len(content)
+        logger.debug("📊 Response size: %s bytes", content_length)
+        
+        # Check for valid street view
+        if content_length <= 3000:  # Real street view images are much larger
+            logger.debug("⚠️ Response too small (%s bytes) - no street view at this location", content_length)
+            return None
+        return content
+    
+    def _draw_placeholder(self, x_pos, y_pos, width, height, border_rgb, fill_rgb, lines, line_width=None):
+        """Framed box with centred text standing in for a missing image
+        
+        lines are (offset from the box middle, cell height, font style, font size, rgb or None to keep, text).
+        """
+        self.set_draw_color(*border_rgb)
+        self.set_fill_color(*fill_rgb)
+        if line_width is not None:
+            self.set_line_width(line_width)
+        self.rect(x_pos, y_pos, width, height, 'DF')
+        
+        middle = y_pos + height / 2
+        for offset, cell_height, style, size, rgb, text in lines:
+            self.set_font('Arial', style, size)
+            if rgb is not None:
+                self.set_text_color(*rgb)
+            self.set_xy(x_pos, middle + offset)
+            self.cell(width, cell_height, text, 0, 0, 'C')
+    
+    def add_street_view_placeholder(self, x_pos, y_pos, width, height, lat, lng):
+        """Add placeholder when street view is not available"""
+        # Crimson border on a light pink background, drawn with a heavier 2 mm line
+        self._draw_placeholder(x_pos, y_pos, width, height, (220, 20, 60), (255, 240, 245), (
+            (-25, 8, 'B', 11, (220, 20, 60), 'STREET VIEW'),
+            (-15, 8, 'B', 11, None, 'NOT AVAILABLE'),
+            (-2, 6, '', 9, (100, 100, 100), f'GPS: {lat:.6f}, {lng:.6f}'),
+            (8, 5, '', 8, None, 'Street imagery not available'),
+            (16, 5, '', 8, None, 'for this exact location.'),
+            (24, 5, '', 8, None, 'Refer to satellite map.'),
+        ), line_width=2)
+        
+        logger.debug("📋 Street View placeholder added for %.4f, %.4f", lat, lng)
+    
+    def _fetch_satellite(self, lat, lng, api_key, width=85, height=50):
+        """Download (or reuse the cached) zoom-18 satellite tile centred on a turn, sized for a
+        width x height mm box (defaults match the turn page layout)"""
+        size = _static_map_size(width, height)
+        url = _static_url(lat, lng, 'satellite', 18, size, api_key)
+        logger.debug("📡 Satellite Map API call...")
+        
+        # Turns within ~10 m of each other share one cached satellite tile
+        # Google's error tiles are under 1000 bytes; reject them on the Content-Length header
+        return self._fetch_map_image(url, timeout=20, cache_key=f"satellite:{size}:{round(lat, 4)},{round(lng, 4)}",
+                                     min_bytes=1001)
     
     def add_satellite_map_image(self, lat, lng, api_key, x_pos=105, y_pos=None, width=85, height=60):
         """Add satellite map image"""
+        if y_pos is None:
+            y_pos = self.get_y()
+        
+        logger.debug("🛰️ Generating Satellite Map for %.6f, %.6f", lat, lng)
+        
         try:
-            if y_pos is None:
-                y_pos = self.get_y()
-            
-            print(f"🛰️ Generating Satellite Map for {lat:.6f}, {lng:.6f}")
-            
-            base_url = "https://maps.googleapis.com/maps/api/staticmap"
-            params = [
-                f"center={lat},{lng}",
-                f"zoom=18",
-                f"size=640x640",
-                f"maptype=satellite",
-                f"markers=color:red|size:mid|{lat},{lng}",
-                f"key={api_key}"
-            ]
-            
-            url = f"{base_url}?" + "&".join(params)
-            print(f"  📡 Satellite Map API call...")
-            
-            response = requests.get(url, timeout=20)
-            
-            if response.status_code == 200:
-                content_length = len(response.content)
-                print(f"  📊 Satellite response size: {content_length} bytes")
-                
-                if content_length > 1000:
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp:
-                        temp.write(response.content)
-                        temp_path = temp.name
-                    
-                    try:
-                        # Add border (blue for satellite)
-                        self.set_draw_color(100, 100, 200)
-                        self.set_line_width(1)
-                        self.rect(x_pos - 1, y_pos - 1, width + 2, height + 2, 'D')
-                        
-                        # Add image
-                        self.image(temp_path, x=x_pos, y=y_pos, w=width, h=height)
-                        
-                        print(f"   Satellite map added successfully")
-                        
-                        # Add small text label
-                        self.set_font('Arial', '', 7)
-                        self.set_text_color(0, 0, 200)
-                        self.set_xy(x_pos, y_pos + height + 1)
-                        self.cell(width, 4, 'Satellite View - Zoom 18', 0, 0, 'C')
-                        
-                        os.unlink(temp_path)
-                        return True
-                        
-                    except Exception as img_error:
-                        print(f"   Invalid satellite image: {img_error}")
-                        os.unlink(temp_path)
-                        self.add_satellite_placeholder(x_pos, y_pos, width, height, lat, lng)
-                        return False
-                else:
-                    print(f"  ⚠️ Satellite response too small ({content_length} bytes)")
-                    self.add_satellite_placeholder(x_pos, y_pos, width, height, lat, lng)
-                    return False
-            else:
-                print(f"   Satellite HTTP {response.status_code}")
-                self.add_satellite_placeholder(x_pos, y_pos, width, height, lat, lng)
-                return False
-            
-        except Exception as e:
-            print(f" Satellite map error: {e}")
+            content = self._fetch_satellite(lat, lng, api_key, width, height)
+        except _MAP_FETCH_ERRORS as e:
+            logger.warning("Satellite map error: %s", e)
+            content = None
+        else:
+            if content is None:
+                logger.warning("Satellite HTTP error")
+        
+        if content is None:
+            self.add_satellite_placeholder(x_pos, y_pos, width, height, lat, lng)
+            return False
+        
+        content_length = len(content)
+        logger.debug("📊 Satellite response size: %s bytes", content_length)
+        
+        if content_length <= 1000:
+            logger.debug("⚠️ Satellite response too small (%s bytes)", content_length)
+            self.add_satellite_placeholder(x_pos, y_pos, width, height, lat, lng)
+            return False
+        
+        image_buf = io.BytesIO(_downscale_image(content))
+        
+        # Add border (blue for satellite)
+        self.set_draw_color(100, 100, 200)
+        self.set_line_width(1)
+        self.rect(x_pos - 1, y_pos - 1, width + 2, height + 2, 'D')
+        
+        # Add image
+        try:
+            self.image(image_buf, x=x_pos, y=y_pos, w=width, h=height)
+        except _MAP_IMAGE_ERRORS as img_error:
+            logger.warning("Invalid satellite image: %s", img_error)
             self.add_satellite_placeholder(x_pos, y_pos, width, height, lat, lng)
             return False
+        
+        logger.debug("Satellite map added successfully")
+        
+        # Add small text label
+        self.set_font('Arial', '', 7)
+        self.set_text_color(0, 0, 200)
+        self.set_xy(x_pos, y_pos + height + 1)
+        self.cell(width, 4, 'Satellite View - Zoom 18', 0, 0, 'C')
+        
+        return True
     
     def add_satellite_placeholder(self, x_pos, y_pos, width, height, lat, lng):
         """Add placeholder when satellite map is not available"""
-        try:
-            # Draw placeholder rectangle
-            self.set_draw_color(150, 150, 200)
-            self.set_fill_color(240, 240, 250)
-            self.rect(x_pos, y_pos, width, height, 'DF')
-            
-            # Add placeholder text
-            self.set_font('Arial', 'B', 10)
-            self.set_text_color(100, 100, 150)
-            self.set_xy(x_pos, y_pos + height/2 - 15)
-            self.cell(width, 6, 'SATELLITE MAP', 0, 0, 'C')
-            
-            self.set_font('Arial', '', 8)
-            self.set_xy(x_pos, y_pos + height/2 - 5)
-            self.cell(width, 5, 'NOT AVAILABLE', 0, 0, 'C')
-            
-            self.set_xy(x_pos, y_pos + height/2 + 5)
-            self.cell(width, 5, f'{lat:.4f}, {lng:.4f}', 0, 0, 'C')
-            
-            self.set_xy(x_pos, y_pos + height/2 + 15)
-            self.cell(width, 5, 'Check API key and quota', 0, 0, 'C')
-            
-        except Exception as e:
-            print(f"Error adding satellite placeholder: {e}")
+        self._draw_placeholder(x_pos, y_pos, width, height, (150, 150, 200), (240, 240, 250), (
+            (-15, 6, 'B', 10, (100, 100, 150), 'SATELLITE MAP'),
+            (-5, 5, '', 8, None, 'NOT AVAILABLE'),
+            (5, 5, '', 8, None, f'{lat:.4f}, {lng:.4f}'),
+            (15, 5, '', 8, None, 'Check API key and quota'),
+        ))
     
     def add_compact_turn_map(self, lat, lng, api_key, map_type='roadmap'):
         """Add single optimized map for the turn"""
@@ -2822,121 +3361,94 @@ class EnhancedRoutePDF(FPDF):
                 self.cell(0, 6, f'GPS: {lat:.6f}, {lng:.6f} | Zoom level optimized for turn analysis', 0, 1, 'C')
             
         except Exception as e:
-            print(f"Error adding compact map: {e}")
+            logger.warning("Error adding compact map: %s", e)
             self.set_font('Arial', '', 10)
             self.set_text_color(0, 0, 0)
             self.cell(0, 6, f'Map generation failed for turn at {lat:.4f}, {lng:.4f}', 0, 1, 'L')
     
     def add_static_map_image(self, lat, lng, api_key, map_type='roadmap', x_pos=30, y_pos=None, width=150, height=80):
         """Add static Google Map image"""
+        if y_pos is None:
+            y_pos = self.get_y()
+        
+        logger.debug("🗺️ Generating %s map for %.6f, %.6f", map_type, lat, lng)
+        
+        size = _static_map_size(width, height)
+        url = _static_url(lat, lng, map_type, 17, size, api_key)
+        logger.debug("📡 Static Map API call (%s)...", map_type)
+        
+        # Keyed on rounded coordinates so repeat calls with float noise share one download
+        cache_key = f"staticmap:{map_type}:17:{size}:{round(lat, 5)},{round(lng, 5)}"
         try:
-            if y_pos is None:
-                y_pos = self.get_y()
-            
-            print(f"🗺️ Generating {map_type} map for {lat:.6f}, {lng:.6f}")
-            
-            base_url = "https://maps.googleapis.com/maps/api/staticmap"
-            params = [
-                f"center={lat},{lng}",
-                f"zoom=17",
-                f"size=640x640",
-                f"maptype={map_type}",
-                f"markers=color:red|size:mid|{lat},{lng}",
-                f"key={api_key}"
-            ]
-            
-            url = f"{base_url}?" + "&".join(params)
-            print(f"  📡 Static Map API call ({map_type})...")
-            
-            response = requests.get(url, timeout=20)
-            
-            if response.status_code == 200:
-                content_length = len(response.content)
-                print(f"  📊 {map_type} response size: {content_length} bytes")
-                
-                if content_length > 1000:
-                    with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp:
-                        temp.write(response.content)
-                        temp_path = temp.name
-                    
-                    try:
-                        # Add border
-                        border_colors = {
-                            'roadmap': (100, 100, 100),
-                            'satellite': (100, 100, 200),
-                            'terrain': (100, 150, 100),
-                            'hybrid': (150, 100, 150)
-                        }
-                        border_color = border_colors.get(map_type, (150, 150, 150))
-                        
-                        self.set_draw_color(*border_color)
-                        self.set_line_width(1)
-                        self.rect(x_pos - 1, y_pos - 1, width + 2, height + 2, 'D')
-                        
-                        # Add image
-                        self.image(temp_path, x=x_pos, y=y_pos, w=width, h=height)
-                        
-                        print(f"   {map_type} map added successfully")
-                        
-                        # Add small text label
-                        self.set_font('Arial', '', 7)
-                        self.set_text_color(*border_color)
-                        self.set_xy(x_pos, y_pos + height + 1)
-                        self.cell(width, 4, f'{map_type.title()} View - Zoom 17', 0, 0, 'C')
-                        
-                        os.unlink(temp_path)
-                        return True
-                        
-                    except Exception as img_error:
-                        print(f"   Invalid {map_type} image: {img_error}")
-                        os.unlink(temp_path)
-                        self.add_map_placeholder(x_pos, y_pos, width, height, lat, lng, map_type)
-                        return False
-                else:
-                    print(f"  ⚠️ {map_type} response too small ({content_length} bytes)")
-                    self.add_map_placeholder(x_pos, y_pos, width, height, lat, lng, map_type)
-                    return False
-            else:
-                print(f"   {map_type} HTTP {response.status_code}")
-                self.add_map_placeholder(x_pos, y_pos, width, height, lat, lng, map_type)
-                return False
-            
-        except Exception as e:
-            print(f" Static map error ({map_type}): {e}")
+            content = self._fetch_map_image(url, timeout=20, cache_key=cache_key, min_bytes=1001)
+        except _MAP_FETCH_ERRORS as e:
+            logger.warning("Static map error (%s): %s", map_type, e)
+            content = None
+        else:
+            if content is None:
+                logger.warning("%s HTTP error", map_type)
+        
+        if content is None:
+            self.add_map_placeholder(x_pos, y_pos, width, height, lat, lng, map_type)
+            return False
+        
+        content_length = len(content)
+        logger.debug("📊 %s response size: %s bytes", map_type, content_length)
+        
+        if content_length <= 1000:
+            logger.debug("⚠️ %s response too small (%s bytes)", map_type, content_length)
+            self.add_map_placeholder(x_pos, y_pos, width, height, lat, lng, map_type)
+            return False
+        
+        image_buf = io.BytesIO(content)
+        
+        # Add border
+        border_colors = {
+            'roadmap': (100, 100, 100),
+            'satellite': (100, 100, 200),
+            'terrain': (100, 150, 100),
+            'hybrid': (150, 100, 150)
+        }
+        border_color = border_colors.get(map_type, (150, 150, 150))
+        
+        self.set_draw_color(*border_color)
+        self.set_line_width(1)
+        self.rect(x_pos - 1, y_pos - 1, width + 2, height + 2, 'D')
+        
+        # Add image
+        try:
+            self.image(image_buf, x=x_pos, y=y_pos, w=width, h=height)
+        except _MAP_IMAGE_ERRORS as img_error:
+            logger.warning("Invalid %s image: %s", map_type, img_error)
             self.add_map_placeholder(x_pos, y_pos, width, height, lat, lng, map_type)
             return False
+        
+        logger.debug("%s map added successfully", map_type)
+        
+        # Add small text label
+        self.set_font('Arial', '', 7)
+        self.set_text_color(*border_color)
+        self.set_xy(x_pos, y_pos + height + 1)
+        self.cell(width, 4, f'{map_type.title()} View - Zoom 17', 0, 0, 'C')
+        
+        return True
  # Continuing from the previous part - Helper methods and main function
     
     def add_map_placeholder(self, x_pos, y_pos, width, height, lat, lng, map_type):
         """Add placeholder when map is not available"""
-        try:
-            # Draw placeholder rectangle
-            self.set_draw_color(180, 180, 180)
-            self.set_fill_color(250, 250, 250)
-            self.rect(x_pos, y_pos, width, height, 'DF')
-            
-            # Add placeholder text
-            self.set_font('Arial', 'B', 12)
-            self.set_text_color(120, 120, 120)
-            self.set_xy(x_pos, y_pos + height/2 - 20)
-            self.cell(width, 8, f'{map_type.upper()} MAP', 0, 0, 'C')
-            
-            self.set_font('Arial', '', 10)
-            self.set_xy(x_pos, y_pos + height/2 - 10)
-            self.cell(width, 6, 'NOT AVAILABLE', 0, 0, 'C')
-            
-            self.set_xy(x_pos, y_pos + height/2)
-            self.cell(width, 6, f'{lat:.4f}, {lng:.4f}', 0, 0, 'C')
-            
-            self.set_font('Arial', '', 8)
-            self.set_xy(x_pos, y_pos + height/2 + 15)
-            self.cell(width, 5, 'Please verify API key and quota limits', 0, 0, 'C')
-            
-        except Exception as e:
-            print(f"Error adding map placeholder: {e}")
+        self._draw_placeholder(x_pos, y_pos, width, height, (180, 180, 180), (250, 250, 250), (
+            (-20, 8, 'B', 12, (120, 120, 120), f'{map_type.upper()} MAP'),
+            (-10, 6, '', 10, None, 'NOT AVAILABLE'),
+            (0, 6, '', 10, None, f'{lat:.4f}, {lng:.4f}'),
+            (15, 5, '', 8, None, 'Please verify API key and quota limits'),
+        ))
     
-    def estimate_poi_location(self, name, location, route_points, index, total_pois):
-        """Estimate POI coordinates and distance from route"""
+    def estimate_poi_location(self, name, location, route_points, index, total_pois, route_radians=None):
+        """Estimate POI coordinates and distance from route
+        
+        route_radians is the optional _route_radians(route_points) array; it is looked up
+        (and cached per route) when not given.
+        """
         if not route_points:
             return 0.0, 0.0, 0.0
         
@@ -2945,17 +3457,21 @@ class EnhancedRoutePDF(FPDF):
         estimated_index = min(int((index / total_pois) * route_length), route_length - 1)
         base_point = route_points[estimated_index]
         
-        # Add small random offset to simulate actual POI location
-        import random
-        random.seed(hash(name) % 1000)  # Consistent random based on name
-        
-        lat_offset = random.uniform(-0.005, 0.005)
-        lng_offset = random.uniform(-0.005, 0.005)
+        # Add small pseudo-random offset to simulate actual POI location
+        lat_offset, lng_offset = _poi_offsets(name)
         
         estimated_lat = base_point[0] + lat_offset
         estimated_lng = base_point[1] + lng_offset
         
         # Calculate distance from nearest route point
+        if route_radians is None:
+            route_radians = self._sampled_route_radians(route_points)
+        if route_radians is not None:
+            _, min_distance = nearest_point(route_radians[0], route_radians[1],
+                                            math.radians(estimated_lat), math.radians(estimated_lng))
+            return estimated_lat, estimated_lng, min_distance
+        
+        # Malformed route points (missing/None coordinates): per-point geodesic as before
         distances = []
         for point in route_points[::10]:  # Sample every 10th point for performance
             try:
@@ -2986,8 +3502,7 @@ class EnhancedRoutePDF(FPDF):
         markers = self.create_comprehensive_markers(route_data)
         
         # Calculate map center
-        center_lat = sum(point[0] for point in route_points) / len(route_points)
-        center_lng = sum(point[1] for point in route_points) / len(route_points)
+        center_lat, center_lng = _route_center(route_points, self._route_points_array(route_points))
         
         # Generate map
         self.set_font('Arial', 'B', 12)
@@ -3026,7 +3541,7 @@ class EnhancedRoutePDF(FPDF):
         # Sharp turn markers (top 10 most dangerous)
         sharp_turns = route_data.get('sharp_turns', [])
         if sharp_turns:
-            sorted_turns = sorted(sharp_turns, key=lambda x: x.get('angle', 0), reverse=True)
+            sorted_turns = self._turns_by_angle(sharp_turns)
             for i, turn in enumerate(sorted_turns[:10], 1):
                 angle = turn.get('angle', 0)
                 color = 'red' if angle > 80 else 'orange' if angle > 70 else 'yellow'
@@ -3095,78 +3610,84 @@ class EnhancedRoutePDF(FPDF):
     
     def add_static_map_with_route(self, center_lat, center_lng, markers, route_points, api_key, zoom=8):
         """Add static map with route and markers"""
+        params = [
+            f"center={center_lat},{center_lng}",
+            f"zoom={zoom}",
+            f"size={_static_map_size(180, 100)}",  # Drawn 180 x 100 mm below
+            "scale=2",
+            "maptype=roadmap",
+            None  # Route path, filled in below once the rest of the URL is known
+        ]
+        path_slot = len(params) - 1
+        
+        # Add markers
+        for marker in markers[:15]:  # Limit markers
+            color = marker.get('color', 'red')
+            label = marker.get('label', '')
+            lat = marker.get('lat')
+            lng = marker.get('lng')
+            
+            if lat and lng:
+                params.append(f"markers=size:mid|color:{color}|label:{label}|{lat},{lng}")
+        
+        params.append(f"key={api_key}")
+        
+        # Encoded polyline (a few bytes per point instead of ~20); start from every point
+        # and halve the density only until the URL fits Google's 8192-character limit
+        points = self._route_points_array(route_points)
+        step = 1
+        while True:
+            if points is not None:
+                path_points = points[::step].tolist()  # One C-level conversion per attempt
+            else:
+                path_points = [(point[0], point[1]) for point in route_points[::step]]
+            if (len(route_points) - 1) % step:
+                path_points.append((route_points[-1][0], route_points[-1][1]))  # Keep the destination
+            params[path_slot] = f"path=color:0x0000ff|weight:3|enc:{polyline.encode(path_points)}"
+            url = f"{_STATIC_MAP_BASE}?" + "&".join(params)
+            if len(url) <= 8192 or len(path_points) <= 2:
+                break
+            step *= 2
+        
         try:
-            # Create route path
-            path_points = route_points[::5]  # Sample every 5th point to avoid URL length limits
-            path_string = '|'.join([f"{point[0]},{point[1]}" for point in path_points])
-            
-            base_url = "https://maps.googleapis.com/maps/api/staticmap"
-            params = [
-                f"center={center_lat},{center_lng}",
-                f"zoom={zoom}",
-                "size=640x400",
-                "maptype=roadmap",
-                f"path=color:0x0000ff|weight:3|{path_string}"
-            ]
-            
-            # Add markers
-            for marker in markers[:15]:  # Limit markers
-                color = marker.get('color', 'red')
-                label = marker.get('label', '')
-                lat = marker.get('lat')
-                lng = marker.get('lng')
-                
-                if lat and lng:
-                    params.append(f"markers=size:mid|color:{color}|label:{label}|{lat},{lng}")
+            content = self._fetch_map_image(url, timeout=25, min_bytes=1001)
+        except _MAP_FETCH_ERRORS as e:
+            logger.warning("Error adding map: %s", e)
+            return False
+        
+        # Error tiles (under 1000 bytes) are treated like a failed request
+        if content is not None and len(content) > 1000:
+            image_buf = io.BytesIO(content)
             
-            params.append(f"key={api_key}")
+            # Add image to PDF
+            current_y = self.get_y()
+            img_width = 180
+            img_height = 100
             
-            url = f"{base_url}?" + "&".join(params)
+            # Check space and add page if needed
+            if current_y + img_height > 270:
+                self.add_page()
+                current_y = self.get_y()
             
-            # Limit URL length
-            if len(url) > 8192:  # Google's URL limit
-                # Fallback: simpler map with fewer points
-                simplified_path = '|'.join([f"{point[0]},{point[1]}" for point in route_points[::20]])
-                params[3] = f"path=color:0x0000ff|weight:3|{simplified_path}"
-                url = f"{base_url}?" + "&".join(params)
+            x_position = (210 - img_width) / 2
             
-            response = requests.get(url, timeout=25)
+            # Add border
+            self.set_draw_color(200, 200, 200)
+            self.set_line_width(1)
+            self.rect(x_position - 2, current_y - 2, img_width + 4, img_height + 4, 'D')
             
-            if response.status_code == 200:
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as temp:
-                    temp.write(response.content)
-                    temp_path = temp.name
-                
-                # Add image to PDF
-                current_y = self.get_y()
-                img_width = 180
-                img_height = 100
-                
-                # Check space and add page if needed
-                if current_y + img_height > 270:
-                    self.add_page()
-                    current_y = self.get_y()
-                
-                x_position = (210 - img_width) / 2
-                
-                # Add border
-                self.set_draw_color(200, 200, 200)
-                self.set_line_width(1)
-                self.rect(x_position - 2, current_y - 2, img_width + 4, img_height + 4, 'D')
-                
-                # Add image
-                self.image(temp_path, x=x_position, y=current_y, w=img_width, h=img_height)
-                
-                os.unlink(temp_path)
-                self.set_y(current_y + img_height + 5)
-                
-                return True
+            # Add image
+            try:
+                self.image(image_buf, x=x_position, y=current_y, w=img_width, h=img_height)
+            except _MAP_IMAGE_ERRORS as e:
+                logger.warning("Error adding map: %s", e)
+                return False
             
-            return False
+            self.set_y(current_y + img_height + 5)
             
-        except Exception as e:
-            print(f"Error adding map: {e}")
-            return False
+            return True
+        
+        return False
     
     def add_map_legend(self):
         """Add comprehensive map legend"""
@@ -3199,9 +3720,8 @@ class EnhancedRoutePDF(FPDF):
         if not sharp_turns:
             return base_score
         
-        blind_spots = len([t for t in sharp_turns if t.get('angle', 0) > 80])
-        sharp_danger = len([t for t in sharp_turns if 70 <= t.get('angle', 0) <= 80])
-        moderate_turns = len([t for t in sharp_turns if 45 <= t.get('angle', 0) < 70])
+        blind_spots, sharp_danger, moderate_turns = _risk_bucket_counts(
+            sharp_turns, angles=self._turn_angles(sharp_turns))
         
         base_score -= blind_spots * 15
         base_score -= sharp_danger * 10
@@ -3213,38 +3733,8 @@ class EnhancedRoutePDF(FPDF):
     
     def get_vehicle_info_by_type(self, vehicle_type):
         """Get vehicle information based on type"""
-        vehicle_profiles = {
-            "heavy_goods_vehicle": {
-                "type": "heavy_goods_vehicle",
-                "weight": 18000,  # 18 tons
-                "passenger_capacity": 2,
-                "vehicle_category": "Heavy Goods Vehicle",
-                "fuel_type": "Diesel"
-            },
-            "medium_goods_vehicle": {
-                "type": "medium_goods_vehicle", 
-                "weight": 8000,   # 8 tons
-                "passenger_capacity": 2,
-                "vehicle_category": "Medium Goods Vehicle",
-                "fuel_type": "Diesel"
-            },
-            "light_vehicle": {
-                "type": "light_motor_vehicle",
-                "weight": 2500,   # 2.5 tons
-                "passenger_capacity": 5,
-                "vehicle_category": "Light Motor Vehicle",
-                "fuel_type": "Petrol"
-            },
-            "bus": {
-                "type": "passenger_vehicle",
-                "weight": 12000,  # 12 tons
-                "passenger_capacity": 45,
-                "vehicle_category": "Passenger Vehicle",
-                "fuel_type": "Diesel"
-            }
-        }
-        
-        return vehicle_profiles.get(vehicle_type, vehicle_profiles["heavy_goods_vehicle"])
+        # A fresh copy per call: the shared profiles must not change when a caller edits its dict
+        return dict(_VEHICLE_PROFILES.get(vehicle_type, _VEHICLE_PROFILES["heavy_goods_vehicle"]))
     
     def generate_simple_compliance_data(self, route_data, vehicle_info):
         """Generate simple compliance data without external dependencies"""
@@ -3275,23 +3765,8 @@ class EnhancedRoutePDF(FPDF):
         }
     
     def parse_duration_to_hours(self, duration_str):
-        """Parse duration string to hours"""
-        try:
-            # Simple parsing
-            if "hour" in duration_str.lower():
-                parts = duration_str.lower().split()
-                for i, part in enumerate(parts):
-                    if "hour" in part and i > 0:
-                        return float(parts[i-1])
-            elif "min" in duration_str.lower():
-                parts = duration_str.lower().split()
-                for i, part in enumerate(parts):
-                    if "min" in part and i > 0:
-                        return float(parts[i-1]) / 60
-            else:
-                return 8.0  # Default assumption
-        except:
-            return 8.0
+        """Parse duration string to hours ("8 hours 30 mins" -> 8.5); 8 hours if nothing parses"""
+        return _duration_hours(duration_str, 8.0)
 
 
 def generate_pdf(filename, from_addr, to_addr, distance, duration, turns, petrol_bunks,
@@ -3303,6 +3778,9 @@ def generate_pdf(filename, from_addr, to_addr, distance, duration, turns, petrol
     WORKING ENHANCED PDF GENERATION WITH REGULATORY COMPLIANCE & FIXED TEXT RENDERING
     """
     
+    # Accept str or pathlib.Path; one conversion here serves output() and the returned name
+    filename = os.fspath(filename)
+    
     # Handle None values
     if not schools: schools = {}
     if not food_stops: food_stops = {}
@@ -3312,13 +3790,23 @@ def generate_pdf(filename, from_addr, to_addr, distance, duration, turns, petrol
     if not risk_segments: risk_segments = []
     if not turns: turns = []
     if not route_data: route_data = {}
+    # One lookup for the turn pages and the closing page count
+    sharp_turns = route_data.get('sharp_turns') or ()
     
+    pdf = None
+    switch_interval = ExitStack()
     try:
         # Create enhanced PDF with proper text handling
         pdf = EnhancedRoutePDF("Enhanced Route Analysis Report with Regulatory Compliance")
         
         print("📄 Starting WORKING Enhanced PDF Generation...")
         
+        # Turn maps and the emergency analysis download in the background while the earlier pages are built
+        pdf.start_turn_map_prefetch(route_data, api_key)
+        pdf.start_emergency_prefetch(route_data, api_key)
+        if pdf._prefetch_executor is not None or pdf._emergency_prefetch is not None:
+            switch_interval.enter_context(_render_switch_interval())
+        
         # 1. Professional title page
         pdf.add_professional_title_page()
         
@@ -3343,10 +3831,12 @@ def generate_pdf(filename, from_addr, to_addr, distance, duration, turns, petrol
         
         
         # 6. *** WORKING FEATURE *** Individual turn analysis pages with street views and maps
-        if api_key and route_data.get('sharp_turns'):
-            critical_turns = [turn for turn in route_data.get('sharp_turns', []) if turn.get('angle', 0) >= 70]
+        # Per-turn pages with maps, or a single summary table when there is no API key
+        if sharp_turns:
+            critical_turns = pdf._critical_turns(sharp_turns)
             if critical_turns:
-                print(f"🔄 Adding {len(critical_turns)} individual turn analysis pages with street views...")
+                if api_key:
+                    print(f"🔄 Adding {len(critical_turns)} individual turn analysis pages with street views...")
                 pdf.add_individual_turn_pages(route_data, api_key)
         # 7. Advanced Features - Elevation Analysis
         if ElevationAnalyzer:
@@ -3357,22 +3847,52 @@ def generate_pdf(filename, from_addr, to_addr, distance, duration, turns, petrol
             pdf.add_emergency_planning_page(route_data, api_key)
         # Save PDF
         pdf.output(filename)
+        if DROP_PDF_PAGE_CACHE:
+            _drop_page_cache(filename)
+        
+        # Actual page count from fpdf, so conditional sections (maps, emergency planning) are reflected
+        total_pages = pdf.page_no()
+        total_turns = len(pdf._critical_turns(sharp_turns))
+        if not total_turns:
+            turn_pages = "no critical turns"
+        elif api_key:
+            turn_pages = f"{total_turns} turn pages"
+        else:
+            turn_pages = f"{total_turns} critical turns in a summary table"
         
-        # Calculate total pages
-        total_turns = len([turn for turn in route_data.get('sharp_turns', []) if turn.get('angle', 0) >= 70])
-        estimated_pages = 8 + total_turns  # Base pages + individual turn pages + compliance pages
-        
-        print(f" WORKING Enhanced PDF report generated successfully: {filename}")
-        print(f"📊 Features: FIXED text rendering, Regulatory compliance, Individual turn analysis, Street views")
-        print(f"📄 Total pages: ~{estimated_pages} (including {total_turns} turn pages + compliance analysis)")
-        print(f"🗺️ Street views and satellite maps included for each critical turn")
-        print(f"📋 WORKING regulatory compliance analysis with CMVR, AIS-140, RTSP requirements")
-        print(f"🔧 FIXED: All emoji and Unicode issues resolved with comprehensive text cleaning")
+        # One write for the whole summary instead of six locked, line-flushed prints
+        print(f" WORKING Enhanced PDF report generated successfully: {filename}\n"
+              f"📊 Features: FIXED text rendering, Regulatory compliance, Individual turn analysis, Street views\n"
+              f"📄 Total pages: {total_pages} (including {turn_pages} + compliance analysis)\n"
+              f"🗺️ Street views and satellite maps included for each critical turn\n"
+              f"📋 WORKING regulatory compliance analysis with CMVR, AIS-140, RTSP requirements\n"
+              f"🔧 FIXED: All emoji and Unicode issues resolved with comprehensive text cleaning")
         
         return filename
         
     except Exception as e:
-        print(f" Error generating WORKING enhanced PDF: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
\ No newline at end of file
+        logger.exception("Error generating WORKING enhanced PDF: %s", e)
+        return None
+    finally:
+        # A section that raised skips output(); stop the turn-map downloads here too
+        if pdf is not None:
+            pdf._stop_turn_map_prefetch()
+        switch_interval.close()
+
+def _generate_pdf_job(job):
+    """Worker entry point for generate_pdfs: one keyword-argument dict per report"""
+    return generate_pdf(**job)
+
+
+def generate_pdfs(jobs, max_workers=None):
+    """Render several independent reports in parallel worker processes.
+    
+    Each job is the keyword arguments for generate_pdf(); results (filename or None)
+    are returned in job order.
+    """
+    jobs = list(jobs)
+    if len(jobs) < 2:
+        return [_generate_pdf_job(job) for job in jobs]
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_generate_pdf_job, jobs))